@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Callable
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -13,26 +14,42 @@ from app.src.core.middleware.request_tracking import get_request_id
 logger = logging.getLogger(__name__)
 
 
-def setup_exception_handlers(app: FastAPI) -> None:
+def setup_exception_handlers(
+    app: FastAPI,
+    *,
+    log: logging.Logger | None = None,
+    request_id_getter: Callable[[], str | None] | None = None,
+    build_api_error_response: (
+        Callable[[BaseAPIException, Request], dict[str, Any]] | None
+    ) = None,
+    build_server_error_response: (
+        Callable[[Exception, Request], dict[str, Any]] | None
+    ) = None,
+) -> None:
     _add_error_schemas_to_openapi(app)
 
     @app.exception_handler(BaseAPIException)
     async def api_exception_handler(
         request: Request, exc: BaseAPIException
     ) -> JSONResponse:
-        logger.warning(
+        # Unset dependencies resolve to the module globals on each call, so
+        # patching those globals still reaches handlers that are registered
+        active_logger = log or logger
+        active_logger.warning(
             f"API exception: {exc.message}",
             extra={
-                "request_id": get_request_id(),
+                "request_id": (request_id_getter or get_request_id)(),
                 "exception_type": type(exc).__name__,
                 "path": request.url.path,
                 "method": request.method,
                 "status_code": exc.status_code,
             },
-            exc_info=exc if logger.isEnabledFor(logging.DEBUG) else None,
+            exc_info=exc if active_logger.isEnabledFor(logging.DEBUG) else None,
         )
 
-        response_data = create_api_error_response(exc, request)
+        response_data = (build_api_error_response or create_api_error_response)(
+            exc, request
+        )
 
         return JSONResponse(
             status_code=exc.status_code,
@@ -46,10 +63,11 @@ def setup_exception_handlers(app: FastAPI) -> None:
         if isinstance(exc, BaseAPIException):
             return await api_exception_handler(request, exc)
 
-        logger.error(
+        active_logger = log or logger
+        active_logger.error(
             "Unhandled exception occurred",
             extra={
-                "request_id": get_request_id(),
+                "request_id": (request_id_getter or get_request_id)(),
                 "exception_type": type(exc).__name__,
                 "path": request.url.path,
                 "method": request.method,
@@ -57,7 +75,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
             exc_info=exc,
         )
 
-        response_data = create_server_error_response(exc, request)
+        response_data = (build_server_error_response or create_server_error_response)(
+            exc, request
+        )
 
         return JSONResponse(
             status_code=500,
@@ -6,6 +6,7 @@ from .builders.task_builder import TaskBuilder
 from .builders.vault_builder import VaultBuilder
 from .infrastructure.api_client import APIClient
 from .infrastructure.environment import EnvironmentFactory
+from .infrastructure.exception_handlers import register_handlers_on
 from .infrastructure.git_mocks import (
     mock_git_repo,
     mock_git_repo_error,
@@ -14,7 +15,7 @@ from .infrastructure.git_mocks import (
 from .infrastructure.mock_factory import MockFactory
 from .infrastructure.performance import PerformanceTracker
 from .scenarios.error_scenarios import ErrorScenarios
-from .utils.test_helpers import freeze_time, wait_for_condition
+from .utils.test_helpers import assert_attrs, freeze_time, wait_for_condition
 
 __all__ = [
     # Assertions
@@ -33,7 +34,9 @@ __all__ = [
     "mock_git_repo",
     "mock_git_repo_error",
     "mock_git_unavailable",
+    "register_handlers_on",
     # Utilities
+    "assert_attrs",
     "freeze_time",
     "wait_for_condition",
     "ErrorScenarios",
@@ -0,0 +1,24 @@
+from typing import Any, Callable
+
+from app.src.core.exceptions.exception_handlers import setup_exception_handlers
+
+
+def register_handlers_on(mock_app: Any, **dependencies: Any) -> dict[type, Callable]:
+    """Run setup_exception_handlers on a mock app and return its handlers.
+
+    The app's ``exception_handler`` decorator is replaced with one that
+    records each handler by the exception type it was registered for.
+    Keyword arguments are passed through to override handler dependencies.
+    """
+    handler_registry: dict[type, Callable] = {}
+
+    def register_handler(exc_type: type) -> Callable[[Callable], Callable]:
+        def decorator(handler_func: Callable) -> Callable:
+            handler_registry[exc_type] = handler_func
+            return handler_func
+
+        return decorator
+
+    mock_app.exception_handler = register_handler
+    setup_exception_handlers(mock_app, **dependencies)
+    return handler_registry
@@ -1,6 +1,6 @@
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Generator
+from typing import Any, Generator
 from unittest.mock import patch
 
 
@@ -26,3 +26,10 @@ def wait_for_condition(
             return True
         time.sleep(interval)
     return False
+
+
+def assert_attrs(obj: Any, /, **expected: Any) -> None:
+    """Assert each named attribute of obj equals its expected value."""
+    for name, value in expected.items():
+        actual = getattr(obj, name)
+        assert actual == value, f"{name}: {actual!r} != {value!r}"
@@ -105,7 +105,6 @@ class TestVaultPullEndpoint:
 
 
 class TestVaultPullFunction:
-    @pytest.mark.asyncio
     async def test_pull_latest_changes_function_success(self):
         mock_git_manager = MagicMock(spec=GitManager)
         mock_git_manager.validate_repository_state.return_value = True
@@ -123,7 +122,6 @@ class TestVaultPullFunction:
         mock_git_manager.validate_repository_state.assert_called_once()
         mock_git_manager.pull_latest.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_pull_latest_changes_function_no_git_manager(self):
         with pytest.raises(HTTPException) as exc_info:
             await pull_latest_changes(None)
@@ -131,7 +129,6 @@ class TestVaultPullFunction:
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Git repository not configured or not available"
 
-    @pytest.mark.asyncio
     async def test_pull_latest_changes_function_invalid_repository(self):
         mock_git_manager = MagicMock(spec=GitManager)
         mock_git_manager.validate_repository_state.return_value = False
@@ -148,7 +145,6 @@ class TestVaultPullFunction:
         mock_git_manager.validate_repository_state.assert_called_once()
         mock_git_manager.pull_latest.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_pull_latest_changes_function_pull_failure(self):
         mock_git_manager = MagicMock(spec=GitManager)
         mock_git_manager.validate_repository_state.return_value = True
@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+import pytest
+
+_MISSING = object()
+
+
+@pytest.fixture(scope="session")
+def request_factory():
+    """Build plain request doubles; omitted attributes are absent from state."""
+
+    def _make_request(authenticated=_MISSING, api_key=_MISSING):
+        state = SimpleNamespace()
+        if authenticated is not _MISSING:
+            state.authenticated = authenticated
+        if api_key is not _MISSING:
+            state.api_key = api_key
+        return SimpleNamespace(state=state)
+
+    return _make_request
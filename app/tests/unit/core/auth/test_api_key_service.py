@@ -56,7 +56,6 @@ class APIKeyServiceTestBase:
 class TestAPIKeyValidation(APIKeyServiceTestBase):
     """Test API key validation functionality with clear intent."""
 
-    @pytest.mark.asyncio
     async def test_accepts_valid_development_key(self, service):
         settings_patch = self.configure_service_settings(service, "development")
         try:
@@ -65,7 +64,6 @@ class TestAPIKeyValidation(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_rejects_invalid_development_key(self, service):
         settings_patch = self.configure_service_settings(service, "development")
         try:
@@ -74,7 +72,6 @@ class TestAPIKeyValidation(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_accepts_valid_production_key(self, service, secrets_manager_mock):
         settings_patch = self.configure_service_settings(service, "production")
         try:
@@ -84,7 +81,6 @@ class TestAPIKeyValidation(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_rejects_invalid_production_key(self, service, secrets_manager_mock):
         settings_patch = self.configure_service_settings(service, "production")
         try:
@@ -94,7 +90,6 @@ class TestAPIKeyValidation(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_handles_concurrent_key_validation(self, service):
         settings_patch = self.configure_service_settings(
             service, "development", CONCURRENT_TEST_KEYS
@@ -120,7 +115,6 @@ class TestCachingMechanism(APIKeyServiceTestBase):
         service._cached_keys = []
         service._cache_timestamp = 0
 
-    @pytest.mark.asyncio
     async def test_cache_prevents_redundant_calls_within_ttl(
         self, service, secrets_manager_mock
     ):
@@ -138,7 +132,6 @@ class TestCachingMechanism(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_cache_refreshes_after_ttl_expiration(
         self, service, secrets_manager_mock
     ):
@@ -164,7 +157,6 @@ class TestCachingMechanism(APIKeyServiceTestBase):
 class TestCacheRefreshBehavior(APIKeyServiceTestBase):
     """Test cache refresh logic in different environments."""
 
-    @pytest.mark.asyncio
     async def test_development_cache_uses_settings(self, service):
         settings_patch = self.configure_service_settings(service, "development")
         try:
@@ -175,7 +167,6 @@ class TestCacheRefreshBehavior(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_production_cache_uses_secrets_manager(
         self, service, secrets_manager_mock
     ):
@@ -191,7 +182,6 @@ class TestCacheRefreshBehavior(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_cache_preserved_on_secrets_manager_failure(
         self, service, secrets_manager_mock
     ):
@@ -211,7 +201,6 @@ class TestCacheRefreshBehavior(APIKeyServiceTestBase):
         finally:
             settings_patch.stop()
 
-    @pytest.mark.asyncio
     async def test_initial_cache_population(self, service):
         settings_patch = self.configure_service_settings(
             service, "development", [TEST_KEY]
@@ -270,7 +259,6 @@ class TestSecurityFeatures:
 class TestServiceInitialization:
     """Test service instantiation and dependency injection."""
 
-    @pytest.mark.asyncio
     async def test_creates_default_secrets_manager(self):
         with patch(
             "app.src.core.auth.api_key_service.SecretsManager"
@@ -283,7 +271,6 @@ class TestServiceInitialization:
             assert service.secrets_manager == mock_instance
             self._assert_initial_cache_state(service)
 
-    @pytest.mark.asyncio
     async def test_uses_provided_secrets_manager(self):
         provided_secrets_manager = AsyncMock(spec=SecretsManager)
 
@@ -300,7 +287,6 @@ class TestServiceInitialization:
 class TestIntegrationScenarios:
     """Integration tests with minimal mocking for realistic behavior."""
 
-    @pytest.mark.asyncio
     async def test_complete_development_workflow(self):
         with patch("app.src.core.auth.api_key_service.get_settings") as settings_mock:
             settings_mock.return_value.environment = "development"
@@ -317,7 +303,6 @@ class TestIntegrationScenarios:
             assert not await service.validate_key("")
             assert not await service.validate_key("dev-api-key-12")  # partial match
 
-    @pytest.mark.asyncio
     async def test_cache_expiration_with_real_timing(self):
         with patch("app.src.core.auth.api_key_service.get_settings") as settings_mock:
             settings_mock.return_value.environment = "development"
@@ -229,7 +229,6 @@ class TestDispatchMethod:
         self.api_key_service = Mock(spec=APIKeyService)
         self.middleware = AuthenticationMiddleware(self.app, self.api_key_service)
 
-    @pytest.mark.asyncio
     async def test_exempt_path_bypasses_authentication(self):
         """Test that exempt paths bypass authentication entirely."""
         request = Mock(spec=Request)
@@ -247,7 +246,6 @@ class TestDispatchMethod:
         # Should not call API key service
         self.api_key_service.validate_key.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_successful_authentication_flow(self):
         """Test complete successful authentication flow."""
         request = Mock(spec=Request)
@@ -273,7 +271,6 @@ class TestDispatchMethod:
         call_next.assert_called_once_with(request)
         assert response == call_next.return_value
 
-    @pytest.mark.asyncio
     async def test_invalid_api_key_returns_error_response(self):
         """Test that invalid API key returns proper error response."""
         request = Mock(spec=Request)
@@ -306,7 +303,6 @@ class TestDispatchMethod:
         # Verify next was NOT called
         call_next.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_missing_authorization_header_returns_error_response(self):
         """Test that missing Authorization header returns proper error response."""
         request = Mock(spec=Request)
@@ -341,7 +337,6 @@ class TestDispatchMethod:
         # Verify API key service was NOT called
         self.api_key_service.validate_key.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_invalid_authorization_format_returns_error_response(self):
         """Test that invalid Authorization format returns proper error response."""
         request = Mock(spec=Request)
@@ -369,7 +364,6 @@ class TestDispatchMethod:
         log_call_args = mock_logger.warning.call_args[0][0]
         assert "172.16.0.5" in log_call_args
 
-    @pytest.mark.asyncio
     async def test_missing_client_ip_uses_unknown_in_logs(self):
         """Test that missing client IP uses 'unknown' in logs."""
         request = Mock(spec=Request)
@@ -393,7 +387,6 @@ class TestDispatchMethod:
         assert "unknown" in log_call_args
         assert "Authentication failed for unknown" in log_call_args
 
-    @pytest.mark.asyncio
     async def test_api_key_service_exception_is_not_caught(self):
         """Test that unexpected APIKeyService exceptions are not caught."""
         request = Mock(spec=Request)
@@ -410,7 +403,6 @@ class TestDispatchMethod:
         with pytest.raises(ValueError, match="Service error"):
             await self.middleware.dispatch(request, call_next)
 
-    @pytest.mark.asyncio
     async def test_multiple_exempt_paths_work_correctly(self):
         """Test that all default exempt paths work correctly."""
         call_next = AsyncMock(return_value=JSONResponse({"status": "ok"}))
@@ -441,7 +433,6 @@ class TestErrorResponseFormat:
         self.api_key_service = Mock(spec=APIKeyService)
         self.middleware = AuthenticationMiddleware(self.app, self.api_key_service)
 
-    @pytest.mark.asyncio
     async def test_authentication_required_error_response_format(self):
         """Test the format of AuthenticationRequiredError responses."""
         request = Mock(spec=Request)
@@ -466,7 +457,6 @@ class TestErrorResponseFormat:
         assert '"Missing Authorization header"' in response_data
         assert "401" in response_data
 
-    @pytest.mark.asyncio
     async def test_invalid_api_key_error_response_format(self):
         """Test the format of InvalidAPIKeyError responses."""
         request = Mock(spec=Request)
@@ -501,7 +491,6 @@ class TestLoggingBehavior:
         self.api_key_service = Mock(spec=APIKeyService)
         self.middleware = AuthenticationMiddleware(self.app, self.api_key_service)
 
-    @pytest.mark.asyncio
     async def test_logging_includes_client_ip_and_error_message(self):
         """Test that logging includes both client IP and error message."""
         request = Mock(spec=Request)
@@ -524,7 +513,6 @@ class TestLoggingBehavior:
         assert log_call.startswith("Authentication failed for 203.0.113.1:")
         assert "Invalid Authorization header format" in log_call
 
-    @pytest.mark.asyncio
     async def test_logging_level_is_warning(self):
         """Test that authentication failures are logged at WARNING level."""
         request = Mock(spec=Request)
@@ -544,7 +532,6 @@ class TestLoggingBehavior:
         mock_logger.error.assert_not_called()
         mock_logger.info.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_successful_authentication_does_not_log(self):
         """Test that successful authentication doesn't generate log entries."""
         request = Mock(spec=Request)
@@ -573,7 +560,6 @@ class TestIntegrationScenarios:
         self.app = Mock(spec=ASGIApp)
         self.api_key_service = Mock(spec=APIKeyService)
 
-    @pytest.mark.asyncio
     async def test_custom_exempt_paths_integration(self):
         """Test middleware with custom exempt paths in realistic scenario."""
         custom_exempt_paths = {"/api/v1/health", "/api/v1/metrics", "/admin/status"}
@@ -604,7 +590,6 @@ class TestIntegrationScenarios:
         assert isinstance(response, JSONResponse)
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_realistic_api_request_flow(self):
         """Test realistic API request flow with valid authentication."""
         middleware = AuthenticationMiddleware(self.app, self.api_key_service)
@@ -641,7 +626,6 @@ class TestIntegrationScenarios:
         call_next.assert_called_once_with(request)
         assert response == call_next.return_value
 
-    @pytest.mark.asyncio
     async def test_concurrent_request_handling(self):
         """Test that middleware handles concurrent requests correctly."""
         import asyncio
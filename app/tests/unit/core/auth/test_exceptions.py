@@ -6,200 +6,146 @@ from app.src.core.auth.exceptions import (
 )
 from app.src.core.exceptions.base_exceptions import BaseAPIException
 
-
-class TestAuthenticationRequiredError:
-    """Test AuthenticationRequiredError behavior and attributes."""
-
-    def test_inherits_from_base_api_exception(self):
-        error = AuthenticationRequiredError()
-
-        assert isinstance(error, BaseAPIException)
-        assert isinstance(error, Exception)
-
-    def test_default_initialization(self):
-        error = AuthenticationRequiredError()
-
-        assert error.message == "Authentication required"
-        assert error.status_code == 401
-        assert error.detail == "Provide valid API key in Authorization header"
-        assert error.should_alert is False
-        assert str(error) == "Authentication required"
-
-    def test_custom_message_initialization(self):
-        custom_message = "You must authenticate to access this resource"
-        error = AuthenticationRequiredError(message=custom_message)
-
-        assert error.message == custom_message
-        assert error.status_code == 401
-        assert error.detail == "Provide valid API key in Authorization header"
-        assert str(error) == custom_message
-
-    def test_maintains_consistent_status_code(self):
-        default_error = AuthenticationRequiredError()
-        custom_error = AuthenticationRequiredError(message="Custom message")
-
-        assert default_error.status_code == 401
-        assert custom_error.status_code == 401
-
-    def test_maintains_consistent_detail(self):
-        default_error = AuthenticationRequiredError()
-        custom_error = AuthenticationRequiredError(message="Custom message")
-
-        expected_detail = "Provide valid API key in Authorization header"
-        assert default_error.detail == expected_detail
-        assert custom_error.detail == expected_detail
-
-    def test_exception_can_be_raised_and_caught(self):
-        with pytest.raises(AuthenticationRequiredError) as exc_info:
-            raise AuthenticationRequiredError()
-
-        assert exc_info.value.status_code == 401
-        assert "Authentication required" in str(exc_info.value)
-
-    def test_exception_chain_preserved(self):
-        original_error = ValueError("Original error")
-
-        with pytest.raises(AuthenticationRequiredError) as exc_info:
-            try:
-                raise original_error
-            except ValueError as e:
-                raise AuthenticationRequiredError() from e
-
-        assert exc_info.value.__cause__ is original_error
+AUTH_MSG = "Authentication required"
+AUTH_DETAIL = "Provide valid API key in Authorization header"
+INVALID_MSG = "Invalid API key"
+INVALID_DETAIL = "The provided API key is not valid"
+
+# Read-only default instances for comparison tests; construction itself is
+# exercised by TestAPIAuthExceptions.
+_DEFAULT_AUTH_REQUIRED = AuthenticationRequiredError()
+_DEFAULT_INVALID_KEY = InvalidAPIKeyError()
+
+_CASE_IDS = ["auth-required", "invalid-key"]
+
+EXC_CASES = [
+    (AuthenticationRequiredError, AUTH_MSG, AUTH_DETAIL),
+    (InvalidAPIKeyError, INVALID_MSG, INVALID_DETAIL),
+]
+
+# Each test is parametrized over only the case fields it reads
+_BY_CASE = pytest.mark.parametrize(
+    "exc_cls,default_msg,default_detail", EXC_CASES, ids=_CASE_IDS
+)
+_BY_CLASS = pytest.mark.parametrize(
+    "exc_cls", [cls for cls, _, _ in EXC_CASES], ids=_CASE_IDS
+)
+_BY_MESSAGE = pytest.mark.parametrize(
+    "exc_cls,default_msg", [(cls, msg) for cls, msg, _ in EXC_CASES], ids=_CASE_IDS
+)
+_BY_DETAIL = pytest.mark.parametrize(
+    "exc_cls,default_detail",
+    [(cls, detail) for cls, _, detail in EXC_CASES],
+    ids=_CASE_IDS,
+)
 
 
-class TestInvalidAPIKeyError:
-    """Test InvalidAPIKeyError behavior and attributes."""
+class TestAPIAuthExceptions:
+    """Test shared behavior and attributes of both auth exceptions."""
 
-    def test_inherits_from_base_api_exception(self):
-        error = InvalidAPIKeyError()
+    @_BY_CLASS
+    def test_inherits_from_base_api_exception(self, exc_cls):
+        error = exc_cls()
 
         assert isinstance(error, BaseAPIException)
         assert isinstance(error, Exception)
 
-    def test_default_initialization(self):
-        error = InvalidAPIKeyError()
+    @_BY_CASE
+    def test_default_initialization(self, exc_cls, default_msg, default_detail):
+        error = exc_cls()
 
-        assert error.message == "Invalid API key"
+        assert error.message == default_msg
         assert error.status_code == 401
-        assert error.detail == "The provided API key is not valid"
+        assert error.detail == default_detail
         assert error.should_alert is False
-        assert str(error) == "Invalid API key"
+        assert str(error) == default_msg
 
-    def test_custom_message_initialization(self):
-        custom_message = "The API key you provided is expired"
-        error = InvalidAPIKeyError(message=custom_message)
+    @_BY_DETAIL
+    def test_custom_message_initialization(self, exc_cls, default_detail):
+        custom_message = "You must authenticate to access this resource"
+        error = exc_cls(message=custom_message)
 
         assert error.message == custom_message
         assert error.status_code == 401
-        assert error.detail == "The provided API key is not valid"
+        assert error.detail == default_detail
         assert str(error) == custom_message
 
-    def test_maintains_consistent_status_code(self):
-        default_error = InvalidAPIKeyError()
-        custom_error = InvalidAPIKeyError(message="Custom message")
+    @_BY_CLASS
+    def test_maintains_consistent_status_code(self, exc_cls):
+        default_error = exc_cls()
+        custom_error = exc_cls(message="Custom message")
 
         assert default_error.status_code == 401
         assert custom_error.status_code == 401
 
-    def test_maintains_consistent_detail(self):
-        default_error = InvalidAPIKeyError()
-        custom_error = InvalidAPIKeyError(message="Custom message")
+    @_BY_DETAIL
+    def test_maintains_consistent_detail(self, exc_cls, default_detail):
+        default_error = exc_cls()
+        custom_error = exc_cls(message="Custom message")
 
-        expected_detail = "The provided API key is not valid"
-        assert default_error.detail == expected_detail
-        assert custom_error.detail == expected_detail
+        assert default_error.detail == default_detail
+        assert custom_error.detail == default_detail
 
-    def test_exception_can_be_raised_and_caught(self):
-        with pytest.raises(InvalidAPIKeyError) as exc_info:
-            raise InvalidAPIKeyError()
+    @_BY_MESSAGE
+    def test_exception_can_be_raised_and_caught(self, exc_cls, default_msg):
+        with pytest.raises(exc_cls, match=default_msg) as exc_info:
+            raise exc_cls()
 
         assert exc_info.value.status_code == 401
-        assert "Invalid API key" in str(exc_info.value)
 
-    def test_exception_chain_preserved(self):
-        original_error = KeyError("Key not found")
 
-        with pytest.raises(InvalidAPIKeyError) as exc_info:
-            try:
-                raise original_error
-            except KeyError as e:
-                raise InvalidAPIKeyError() from e
+@pytest.mark.parametrize(
+    "wrapper,source",
+    [
+        pytest.param(
+            AuthenticationRequiredError,
+            ValueError("Original error"),
+            id="auth-from-valueerror",
+        ),
+        pytest.param(
+            InvalidAPIKeyError, KeyError("Key not found"), id="invalid-from-keyerror"
+        ),
+    ],
+)
+def test_exception_chain_preserved(wrapper, source):
+    with pytest.raises(wrapper) as exc_info:
+        try:
+            raise source
+        except type(source) as e:
+            raise wrapper() from e
 
-        assert exc_info.value.__cause__ is original_error
+    assert exc_info.value.__cause__ is source
 
 
 class TestExceptionComparison:
     """Test differences between the two exception types."""
 
-    def test_different_default_messages(self):
-        auth_required = AuthenticationRequiredError()
-        invalid_key = InvalidAPIKeyError()
-
-        assert auth_required.message != invalid_key.message
-        assert auth_required.message == "Authentication required"
-        assert invalid_key.message == "Invalid API key"
-
-    def test_different_detail_messages(self):
-        auth_required = AuthenticationRequiredError()
-        invalid_key = InvalidAPIKeyError()
-
-        assert auth_required.detail != invalid_key.detail
-        assert "Provide valid API key" in auth_required.detail
-        assert "provided API key is not valid" in invalid_key.detail
-
-    def test_same_status_code(self):
-        auth_required = AuthenticationRequiredError()
-        invalid_key = InvalidAPIKeyError()
-
-        assert auth_required.status_code == invalid_key.status_code == 401
+    @pytest.mark.parametrize(
+        "attr,expected_auth,expected_invalid",
+        [
+            ("message", AUTH_MSG, INVALID_MSG),
+            ("status_code", 401, 401),
+            (
+                "detail",
+                AUTH_DETAIL,
+                INVALID_DETAIL,
+            ),
+        ],
+    )
+    def test_attribute_values(self, attr, expected_auth, expected_invalid):
+        assert getattr(_DEFAULT_AUTH_REQUIRED, attr) == expected_auth
+        assert getattr(_DEFAULT_INVALID_KEY, attr) == expected_invalid
 
     def test_both_exceptions_are_distinguishable(self):
-        auth_required = AuthenticationRequiredError()
-        invalid_key = InvalidAPIKeyError()
-
-        assert type(auth_required) is not type(invalid_key)
-        assert isinstance(auth_required, AuthenticationRequiredError)
-        assert isinstance(invalid_key, InvalidAPIKeyError)
-        assert not isinstance(auth_required, InvalidAPIKeyError)
-        assert not isinstance(invalid_key, AuthenticationRequiredError)
+        assert type(_DEFAULT_AUTH_REQUIRED) is not type(_DEFAULT_INVALID_KEY)
 
 
 class TestExceptionUsageScenarios:
     """Test realistic usage scenarios for both exceptions."""
 
-    def test_authentication_required_scenario(self):
-        """Test typical use case for AuthenticationRequiredError."""
-
-        def protected_endpoint(api_key=None):
-            if not api_key:
-                raise AuthenticationRequiredError()
-            return "Success"
-
-        with pytest.raises(AuthenticationRequiredError) as exc_info:
-            protected_endpoint()
-
-        error = exc_info.value
-        assert error.status_code == 401
-        assert "Authentication required" in error.message
-        assert "Provide valid API key" in error.detail
-
-    def test_invalid_key_scenario(self):
-        """Test typical use case for InvalidAPIKeyError."""
-
-        def validate_api_key(api_key):
-            valid_keys = ["valid-key-1", "valid-key-2"]
-            if api_key not in valid_keys:
-                raise InvalidAPIKeyError()
-            return True
-
-        with pytest.raises(InvalidAPIKeyError) as exc_info:
-            validate_api_key("invalid-key")
-
-        error = exc_info.value
-        assert error.status_code == 401
-        assert "Invalid API key" in error.message
-        assert "provided API key is not valid" in error.detail
+    # Single-exception raise/attribute scenarios are covered by
+    # TestAPIAuthExceptions::test_default_initialization and
+    # TestAPIAuthExceptions::test_exception_can_be_raised_and_caught.
 
     def test_exception_handling_in_auth_flow(self):
         """Test handling both exceptions in authentication flow."""
@@ -1,51 +1,81 @@
+import json
 from datetime import datetime, timezone
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.src.core.auth.models import AuthContext, KeyMetadata
 
+pytestmark = pytest.mark.filterwarnings("error")
+
+FROZEN_DT = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+_AUTH_ADAPTER = TypeAdapter(AuthContext)
+
+VALID_META = KeyMetadata(key_id="valid-metadata", created_at=FROZEN_DT)
+
+
+def _errors(error: ValidationError) -> list:
+    """Return error dicts without the url/context/input fields tests never read."""
+    return error.errors(include_url=False, include_context=False, include_input=False)
+
+
+@pytest.fixture(scope="module")
+def base_metadata():
+    """Read-only KeyMetadata built from required fields only."""
+    return KeyMetadata(key_id="test-key", created_at=FROZEN_DT)
+
+
+@pytest.fixture(scope="module")
+def base_context():
+    """Read-only AuthContext built from the required api_key only."""
+    return AuthContext(api_key="test-api-key")
+
+
+@pytest.fixture(scope="module")
+def key_fields():
+    """Field definitions of KeyMetadata."""
+    return KeyMetadata.model_fields
+
+
+@pytest.fixture(scope="module")
+def auth_fields():
+    """Field definitions of AuthContext."""
+    return AuthContext.model_fields
+
 
 class TestKeyMetadata:
     """Test KeyMetadata Pydantic model."""
 
-    def test_creates_with_required_fields(self):
+    def test_creates_with_required_fields(self, base_metadata):
         """Test creating KeyMetadata with required fields only."""
-        metadata = KeyMetadata(
-            key_id="test-key-123",
-            created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-        )
-
-        assert metadata.key_id == "test-key-123"
-        assert metadata.created_at == datetime(
-            2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc
-        )
-        assert metadata.last_used is None
-        assert metadata.requests_today == 0
+        assert base_metadata.key_id == "test-key"
+        assert base_metadata.created_at == FROZEN_DT
+        assert base_metadata.last_used is None
+        assert base_metadata.requests_today == 0
 
     def test_creates_with_all_fields(self):
         """Test creating KeyMetadata with all fields provided."""
-        created_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         last_used_time = datetime(2025, 1, 2, 15, 30, 0, tzinfo=timezone.utc)
 
         metadata = KeyMetadata(
             key_id="comprehensive-key",
-            created_at=created_time,
+            created_at=FROZEN_DT,
             last_used=last_used_time,
             requests_today=42,
         )
 
         assert metadata.key_id == "comprehensive-key"
-        assert metadata.created_at == created_time
+        assert metadata.created_at == FROZEN_DT
         assert metadata.last_used == last_used_time
         assert metadata.requests_today == 42
 
     def test_validates_key_id_required(self):
         """Test that key_id is required."""
         with pytest.raises(ValidationError) as exc_info:
-            KeyMetadata(created_at=datetime.now(timezone.utc))
+            KeyMetadata(created_at=FROZEN_DT)
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert error["type"] == "missing"
         assert "key_id" in error["loc"]
 
@@ -54,7 +84,7 @@ class TestKeyMetadata:
         with pytest.raises(ValidationError) as exc_info:
             KeyMetadata(key_id="test-key")
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert error["type"] == "missing"
         assert "created_at" in error["loc"]
 
@@ -63,10 +93,10 @@ class TestKeyMetadata:
         with pytest.raises(ValidationError) as exc_info:
             KeyMetadata(
                 key_id=123,  # Invalid type
-                created_at=datetime.now(timezone.utc),
+                created_at=FROZEN_DT,
             )
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert error["type"] == "string_type"
         assert "key_id" in error["loc"]
 
@@ -86,7 +116,7 @@ class TestKeyMetadata:
                 created_at="invalid-date",
             )
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert "created_at" in error["loc"]
 
     def test_validates_last_used_type(self):
@@ -94,24 +124,23 @@ class TestKeyMetadata:
         # Valid None
         metadata = KeyMetadata(
             key_id="test-key",
-            created_at=datetime.now(timezone.utc),
+            created_at=FROZEN_DT,
             last_used=None,
         )
         assert metadata.last_used is None
 
         # Valid datetime
-        last_used_time = datetime.now(timezone.utc)
         metadata = KeyMetadata(
             key_id="test-key",
-            created_at=datetime.now(timezone.utc),
-            last_used=last_used_time,
+            created_at=FROZEN_DT,
+            last_used=FROZEN_DT,
         )
-        assert metadata.last_used == last_used_time
+        assert metadata.last_used == FROZEN_DT
 
         # Valid datetime string gets converted
         metadata = KeyMetadata(
             key_id="test-key",
-            created_at=datetime.now(timezone.utc),
+            created_at=FROZEN_DT,
             last_used="2025-01-01T12:00:00Z",
         )
         assert isinstance(metadata.last_used, datetime)
@@ -120,11 +149,11 @@ class TestKeyMetadata:
         with pytest.raises(ValidationError) as exc_info:
             KeyMetadata(
                 key_id="test-key",
-                created_at=datetime.now(timezone.utc),
+                created_at=FROZEN_DT,
                 last_used="invalid-date",
             )
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert "last_used" in error["loc"]
 
     def test_validates_requests_today_type(self):
@@ -132,7 +161,7 @@ class TestKeyMetadata:
         # Valid string number gets converted
         metadata = KeyMetadata(
             key_id="test-key",
-            created_at=datetime.now(timezone.utc),
+            created_at=FROZEN_DT,
             requests_today="10",
         )
         assert metadata.requests_today == 10
@@ -142,27 +171,22 @@ class TestKeyMetadata:
         with pytest.raises(ValidationError) as exc_info:
             KeyMetadata(
                 key_id="test-key",
-                created_at=datetime.now(timezone.utc),
+                created_at=FROZEN_DT,
                 requests_today="not-a-number",
             )
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert "requests_today" in error["loc"]
 
-    def test_requests_today_defaults_to_zero(self):
+    def test_requests_today_defaults_to_zero(self, base_metadata):
         """Test that requests_today defaults to 0."""
-        metadata = KeyMetadata(
-            key_id="test-key",
-            created_at=datetime.now(timezone.utc),
-        )
-
-        assert metadata.requests_today == 0
+        assert base_metadata.requests_today == 0
 
     def test_allows_negative_requests_today(self):
         """Test that negative requests_today values are allowed."""
         metadata = KeyMetadata(
             key_id="test-key",
-            created_at=datetime.now(timezone.utc),
+            created_at=FROZEN_DT,
             requests_today=-5,
         )
 
@@ -170,12 +194,11 @@ class TestKeyMetadata:
 
     def test_serialization_to_dict(self):
         """Test serializing KeyMetadata to dictionary."""
-        created_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         last_used_time = datetime(2025, 1, 2, 15, 30, 0, tzinfo=timezone.utc)
 
-        metadata = KeyMetadata(
+        metadata = KeyMetadata.model_construct(
             key_id="serialize-test",
-            created_at=created_time,
+            created_at=FROZEN_DT,
             last_used=last_used_time,
             requests_today=100,
         )
@@ -183,41 +206,42 @@ class TestKeyMetadata:
         data = metadata.model_dump()
 
         assert data["key_id"] == "serialize-test"
-        assert data["created_at"] == created_time
+        assert data["created_at"] == FROZEN_DT
         assert data["last_used"] == last_used_time
         assert data["requests_today"] == 100
 
     def test_json_serialization(self):
         """Test JSON serialization of KeyMetadata."""
-        metadata = KeyMetadata(
+        metadata = KeyMetadata.model_construct(
             key_id="json-test",
-            created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            created_at=FROZEN_DT,
             last_used=None,
             requests_today=50,
         )
 
-        json_str = metadata.model_dump_json()
-        assert "json-test" in json_str
-        assert "2025-01-01T12:00:00" in json_str
-        assert "null" in json_str  # last_used is None
-        assert "50" in json_str
+        data = json.loads(metadata.model_dump_json())
+
+        assert data == {
+            "key_id": "json-test",
+            "created_at": "2025-01-01T12:00:00Z",
+            "last_used": None,
+            "requests_today": 50,
+        }
 
 
 class TestAuthContext:
     """Test AuthContext Pydantic model."""
 
-    def test_creates_with_api_key_only(self):
+    def test_creates_with_api_key_only(self, base_context):
         """Test creating AuthContext with only required api_key."""
-        context = AuthContext(api_key="test-api-key")
-
-        assert context.api_key == "test-api-key"
-        assert context.metadata is None
+        assert base_context.api_key == "test-api-key"
+        assert base_context.metadata is None
 
     def test_creates_with_api_key_and_metadata(self):
         """Test creating AuthContext with api_key and metadata."""
         metadata = KeyMetadata(
             key_id="context-key",
-            created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            created_at=FROZEN_DT,
             requests_today=25,
         )
 
@@ -233,7 +257,7 @@ class TestAuthContext:
         with pytest.raises(ValidationError) as exc_info:
             AuthContext()
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert error["type"] == "missing"
         assert "api_key" in error["loc"]
 
@@ -242,42 +266,41 @@ class TestAuthContext:
         with pytest.raises(ValidationError) as exc_info:
             AuthContext(api_key=12345)  # Invalid type
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert error["type"] == "string_type"
         assert "api_key" in error["loc"]
 
-    def test_validates_metadata_type(self):
-        """Test that metadata must be KeyMetadata or None."""
-        # Valid None
-        context = AuthContext(api_key="test-key", metadata=None)
-        assert context.metadata is None
-
-        # Valid KeyMetadata
-        metadata = KeyMetadata(
-            key_id="valid-metadata",
-            created_at=datetime.now(timezone.utc),
-        )
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            pytest.param(None, id="none"),
+            pytest.param(VALID_META, id="key-metadata"),
+        ],
+    )
+    def test_validates_metadata_type(self, metadata):
+        """Test that metadata accepts KeyMetadata or None."""
         context = AuthContext(api_key="test-key", metadata=metadata)
+
         assert context.metadata == metadata
 
-        # Invalid type
+    def test_validates_metadata_type_rejects_invalid(self):
+        """Test that metadata of any other type is rejected."""
         with pytest.raises(ValidationError) as exc_info:
             AuthContext(api_key="test-key", metadata="invalid-metadata")
 
-        error = exc_info.value.errors()[0]
+        error = _errors(exc_info.value)[0]
         assert "metadata" in error["loc"]
 
-    def test_metadata_defaults_to_none(self):
+    def test_metadata_defaults_to_none(self, base_context):
         """Test that metadata defaults to None."""
-        context = AuthContext(api_key="default-test")
-
-        assert context.metadata is None
+        assert base_context.metadata is None
 
     def test_serialization_to_dict(self):
         """Test serializing AuthContext to dictionary."""
-        metadata = KeyMetadata(
+        metadata = KeyMetadata.model_construct(
             key_id="serialize-context",
-            created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            created_at=FROZEN_DT,
+            last_used=None,
             requests_today=75,
         )
 
@@ -290,22 +313,20 @@ class TestAuthContext:
         assert data["metadata"]["key_id"] == "serialize-context"
         assert data["metadata"]["requests_today"] == 75
 
-    def test_serialization_with_none_metadata(self):
+    def test_serialization_with_none_metadata(self, base_context):
         """Test serializing AuthContext with None metadata."""
-        context = AuthContext(api_key="none-metadata-key")
+        data = base_context.model_dump()
 
-        data = context.model_dump()
-
-        assert data["api_key"] == "none-metadata-key"
+        assert data["api_key"] == "test-api-key"
         assert data["metadata"] is None
 
     def test_json_serialization(self):
         """Test JSON serialization of AuthContext."""
         context = AuthContext(api_key="json-context-key")
 
-        json_str = context.model_dump_json()
-        assert "json-context-key" in json_str
-        assert "null" in json_str  # metadata is None
+        data = json.loads(context.model_dump_json())
+
+        assert data == {"api_key": "json-context-key", "metadata": None}
 
 
 class TestModelIntegration:
@@ -315,7 +336,7 @@ class TestModelIntegration:
         """Test successful validation of nested KeyMetadata in AuthContext."""
         metadata_data = {
             "key_id": "integration-key",
-            "created_at": datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            "created_at": FROZEN_DT,
             "last_used": datetime(2025, 1, 2, 10, 0, 0, tzinfo=timezone.utc),
             "requests_today": 150,
         }
@@ -336,12 +357,12 @@ class TestModelIntegration:
                 api_key="test-key",
                 metadata=KeyMetadata(
                     key_id=None,  # Invalid: required field
-                    created_at=datetime.now(timezone.utc),
+                    created_at=FROZEN_DT,
                 ),
             )
 
         # Should have validation error for key_id
-        errors = exc_info.value.errors()
+        errors = _errors(exc_info.value)
         assert any("key_id" in str(error["loc"]) for error in errors)
 
     def test_from_dict_construction(self):
@@ -359,22 +380,16 @@ class TestModelIntegration:
         }
 
         # This tests Pydantic's ability to parse nested dictionaries
-        context = AuthContext.model_validate(context_dict)
+        context = _AUTH_ADAPTER.validate_python(context_dict)
 
         assert context.api_key == "dict-api-key"
         assert context.metadata.key_id == "dict-key"
         assert context.metadata.last_used is None
 
-    def test_partial_metadata_construction(self):
+    def test_partial_metadata_construction(self, base_metadata):
         """Test creating AuthContext with partial metadata."""
-        context = AuthContext(
-            api_key="partial-test",
-            metadata=KeyMetadata(
-                key_id="partial-key",
-                created_at=datetime.now(timezone.utc),
-                # last_used and requests_today use defaults
-            ),
-        )
+        # base_metadata leaves last_used and requests_today at their defaults
+        context = AuthContext(api_key="partial-test", metadata=base_metadata)
 
         assert context.metadata.last_used is None
         assert context.metadata.requests_today == 0
@@ -383,27 +398,32 @@ class TestModelIntegration:
 class TestFieldDescriptions:
     """Test that field descriptions are properly set."""
 
-    def test_keymetadata_field_descriptions(self):
+    @pytest.mark.parametrize(
+        "field,expected",
+        [
+            ("key_id", "Unique identifier for the API key"),
+            ("created_at", "When the key was created"),
+            ("last_used", "Last usage timestamp"),
+            ("requests_today", "Number of requests made today"),
+        ],
+    )
+    def test_keymetadata_field_descriptions(self, key_fields, field, expected):
         """Test KeyMetadata field descriptions."""
-        fields = KeyMetadata.model_fields
-
-        assert fields["key_id"].description == "Unique identifier for the API key"
-        assert fields["created_at"].description == "When the key was created"
-        assert fields["last_used"].description == "Last usage timestamp"
-        assert fields["requests_today"].description == "Number of requests made today"
-
-    def test_authcontext_field_descriptions(self):
+        assert key_fields[field].description == expected
+
+    @pytest.mark.parametrize(
+        "field,expected",
+        [
+            ("api_key", "The validated API key"),
+            ("metadata", "Key metadata if available"),
+        ],
+    )
+    def test_authcontext_field_descriptions(self, auth_fields, field, expected):
         """Test AuthContext field descriptions."""
-        fields = AuthContext.model_fields
-
-        assert fields["api_key"].description == "The validated API key"
-        assert fields["metadata"].description == "Key metadata if available"
+        assert auth_fields[field].description == expected
 
-    def test_field_requirements(self):
+    def test_field_requirements(self, key_fields, auth_fields):
         """Test field requirement settings."""
-        key_fields = KeyMetadata.model_fields
-        auth_fields = AuthContext.model_fields
-
         # Required fields
         assert key_fields["key_id"].is_required()
         assert key_fields["created_at"].is_required()
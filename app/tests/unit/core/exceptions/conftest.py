@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.src.core.exceptions.item_exceptions import (
+    ItemConflictError,
+    ItemDateParsingError,
+    ItemNotFoundError,
+    ItemStateTransitionError,
+    ItemValidationError,
+)
+
+
+@pytest.fixture
+def mock_request():
+    """Request double for GET /api/test exposing only url.path and method."""
+    return SimpleNamespace(url=SimpleNamespace(path="/api/test"), method="GET")
+
+
+# Module-scoped item exceptions are shared by every test in a module, so
+# tests using them must only read attributes, never set them.
+
+
+@pytest.fixture(scope="module")
+def not_found_task():
+    """ItemNotFoundError with a generated 'Task '123' not found' message."""
+    return ItemNotFoundError(item_type="task", item_id="123")
+
+
+@pytest.fixture(scope="module")
+def validation_email():
+    """ItemValidationError for an invalid email field."""
+    return ItemValidationError(
+        "Invalid email format", field="email", value="not-an-email"
+    )
+
+
+@pytest.fixture(scope="module")
+def date_error():
+    """ItemDateParsingError for an unparseable due date."""
+    return ItemDateParsingError(date_string="2023-13-45", field="due_date")
+
+
+@pytest.fixture(scope="module")
+def state_error():
+    """ItemStateTransitionError for editing a completed task."""
+    return ItemStateTransitionError(
+        item_type="task", current_state="completed", attempted_action="edit"
+    )
+
+
+@pytest.fixture(scope="module")
+def conflict_error():
+    """ItemConflictError for an already registered email."""
+    return ItemConflictError(
+        "Email already registered",
+        conflicting_field="email",
+        conflicting_value="user@example.com",
+    )
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        "not_found_task",
+        "validation_email",
+        "date_error",
+        "state_error",
+        "conflict_error",
+    ],
+)
+def any_item_exception(request):
+    """Each shared item exception subclass instance in turn."""
+    return request.getfixturevalue(request.param)
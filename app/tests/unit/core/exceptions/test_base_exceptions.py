@@ -2,6 +2,24 @@ import pytest
 
 from app.src.core.exceptions.base_exceptions import BaseAPIException
 
+_ORIGINAL_ERRORS = (
+    ValueError("Value error"),
+    TypeError("Type error"),
+    RuntimeError("Runtime error"),
+    KeyError("Key error"),
+    AttributeError("Attribute error"),
+)
+
+
+def _make(message="msg", **kwargs):
+    return BaseAPIException(message, **kwargs)
+
+
+@pytest.fixture(scope="class")
+def shared_exc():
+    """Single instance for tests that only read attributes."""
+    return BaseAPIException("shared-msg")
+
 
 class TestBaseAPIException:
     """Test BaseAPIException class."""
@@ -33,34 +51,38 @@ class TestBaseAPIException:
             should_alert=should_alert,
         )
 
-        assert exception.message == message
-        assert exception.status_code == status_code
-        assert exception.detail == detail
-        assert exception.should_alert == should_alert
-        assert exception.__cause__ is original_error
-
-    def test_constructor_with_custom_status_code(self):
-        """Test creating exception with custom status code."""
-        test_cases = [
+        assert (
+            exception.message,
+            exception.status_code,
+            exception.detail,
+            exception.should_alert,
+            exception.__cause__,
+        ) == (message, status_code, detail, should_alert, original_error)
+
+    @pytest.mark.parametrize(
+        "status_code,message",
+        [
             (400, "Bad Request"),
             (401, "Unauthorized"),
             (403, "Forbidden"),
             (404, "Not Found"),
             (422, "Unprocessable Entity"),
             (500, "Internal Server Error"),
-        ]
+        ],
+    )
+    def test_constructor_with_custom_status_code(self, status_code, message):
+        """Test creating exception with custom status code."""
+        exception = _make(message, status_code=status_code)
 
-        for status_code, message in test_cases:
-            exception = BaseAPIException(message, status_code=status_code)
-            assert exception.status_code == status_code
-            assert exception.message == message
+        assert exception.status_code == status_code
+        assert exception.message == message
 
     def test_constructor_with_detail(self):
         """Test creating exception with detail information."""
         message = "Validation failed"
         detail = "Field 'email' is required but was not provided"
 
-        exception = BaseAPIException(message, detail=detail)
+        exception = _make(message, detail=detail)
 
         assert exception.message == message
         assert exception.detail == detail
@@ -68,41 +90,35 @@ class TestBaseAPIException:
 
     def test_constructor_with_should_alert_true(self):
         """Test creating exception with should_alert set to True."""
-        message = "Critical system error"
-        exception = BaseAPIException(message, should_alert=True)
+        exception = _make(should_alert=True)
 
-        assert exception.message == message
+        assert exception.message == "msg"
         assert exception.should_alert is True
 
     def test_constructor_with_should_alert_false(self):
         """Test creating exception with should_alert explicitly set to False."""
-        message = "Non-critical error"
-        exception = BaseAPIException(message, should_alert=False)
+        exception = _make(should_alert=False)
 
-        assert exception.message == message
+        assert exception.message == "msg"
         assert exception.should_alert is False
 
     def test_original_error_sets_cause(self):
         """Test that providing original_error sets __cause__ correctly."""
         original_error = RuntimeError("Database connection failed")
-        exception = BaseAPIException(
-            "Service unavailable", original_error=original_error
-        )
+        exception = _make(original_error=original_error)
 
         assert exception.__cause__ is original_error
 
     def test_no_original_error_no_cause(self):
         """Test that without original_error, __cause__ remains None."""
-        exception = BaseAPIException("Simple error")
+        exception = _make()
 
         assert exception.__cause__ is None
 
-    def test_inheritance_from_exception(self):
+    def test_inheritance_from_exception(self, shared_exc):
         """Test that BaseAPIException properly inherits from Exception."""
-        exception = BaseAPIException("Test inheritance")
-
-        assert isinstance(exception, Exception)
-        assert isinstance(exception, BaseAPIException)
+        assert isinstance(shared_exc, Exception)
+        assert isinstance(shared_exc, BaseAPIException)
         assert issubclass(BaseAPIException, Exception)
 
     def test_can_be_raised_and_caught(self):
@@ -125,12 +141,9 @@ class TestBaseAPIException:
         assert isinstance(exc_info.value, BaseAPIException)
         assert str(exc_info.value) == message
 
-    def test_string_representation(self):
+    def test_string_representation(self, shared_exc):
         """Test string representation of the exception."""
-        message = "String representation test"
-        exception = BaseAPIException(message)
-
-        assert str(exception) == message
+        assert str(shared_exc) == "shared-msg"
 
     def test_string_representation_with_details(self):
         """Test string representation includes the message."""
@@ -141,14 +154,12 @@ class TestBaseAPIException:
         # The string representation should be the message
         assert str(exception) == message
 
-    def test_repr_representation(self):
+    def test_repr_representation(self, shared_exc):
         """Test repr representation of the exception."""
-        message = "Repr test"
-        exception = BaseAPIException(message)
+        repr_str = repr(shared_exc)
 
-        repr_str = repr(exception)
         assert "BaseAPIException" in repr_str
-        assert message in repr_str
+        assert "shared-msg" in repr_str
 
     def test_empty_string_message(self):
         """Test creating exception with empty string message."""
@@ -159,13 +170,13 @@ class TestBaseAPIException:
 
     def test_none_detail_explicitly(self):
         """Test creating exception with explicitly None detail."""
-        exception = BaseAPIException("Test", detail=None)
+        exception = _make(detail=None)
 
         assert exception.detail is None
 
     def test_none_original_error_explicitly(self):
         """Test creating exception with explicitly None original_error."""
-        exception = BaseAPIException("Test", original_error=None)
+        exception = _make(original_error=None)
 
         assert exception.__cause__ is None
 
@@ -200,31 +211,26 @@ class TestBaseAPIException:
         exception.detail = "Added detail"
         exception.should_alert = True
 
-        assert exception.message == "Modified message"
-        assert exception.status_code == 418
-        assert exception.detail == "Added detail"
-        assert exception.should_alert is True
-
-    def test_with_different_exception_types_as_original_error(self):
+        assert (
+            exception.message,
+            exception.status_code,
+            exception.detail,
+            exception.should_alert,
+        ) == ("Modified message", 418, "Added detail", True)
+
+    @pytest.mark.parametrize(
+        "original_error", _ORIGINAL_ERRORS, ids=lambda error: type(error).__name__
+    )
+    def test_with_different_exception_types_as_original_error(self, original_error):
         """Test with various exception types as original_error."""
-        original_errors = [
-            ValueError("Value error"),
-            TypeError("Type error"),
-            RuntimeError("Runtime error"),
-            KeyError("Key error"),
-            AttributeError("Attribute error"),
-        ]
-
-        for original_error in original_errors:
-            exception = BaseAPIException("Wrapper error", original_error=original_error)
-            assert exception.__cause__ is original_error
-            assert isinstance(exception.__cause__, type(original_error))
-
-    def test_boolean_evaluation(self):
-        """Test that exception evaluates to True in boolean context."""
-        exception = BaseAPIException("Test")
+        exception = _make(original_error=original_error)
+
+        assert exception.__cause__ is original_error
+        assert isinstance(exception.__cause__, type(original_error))
 
-        assert bool(exception) is True
+    def test_boolean_evaluation(self, shared_exc):
+        """Test that exception evaluates to True in boolean context."""
+        assert bool(shared_exc) is True
 
     def test_equality_and_identity(self):
         """Test equality and identity behavior."""
@@ -239,13 +245,10 @@ class TestBaseAPIException:
         # (Exception base class handles equality by message)
         assert exception1.args == exception2.args
 
-    def test_args_attribute(self):
+    def test_args_attribute(self, shared_exc):
         """Test that args attribute is set correctly."""
-        message = "Test args"
-        exception = BaseAPIException(message)
-
         # Exception base class sets args from the message
-        assert exception.args == (message,)
+        assert shared_exc.args == ("shared-msg",)
 
     def test_comprehensive_scenario(self):
         """Test a comprehensive real-world scenario."""
@@ -263,14 +266,19 @@ class TestBaseAPIException:
             )
 
             # Verify all attributes
-            assert api_exception.message == "Service temporarily unavailable"
-            assert api_exception.status_code == 503
             assert (
-                api_exception.detail
-                == "Database connection failed after 30 second timeout"
+                api_exception.message,
+                api_exception.status_code,
+                api_exception.detail,
+                api_exception.should_alert,
+                api_exception.__cause__,
+            ) == (
+                "Service temporarily unavailable",
+                503,
+                "Database connection failed after 30 second timeout",
+                True,
+                db_error,
             )
-            assert api_exception.should_alert is True
-            assert api_exception.__cause__ is db_error
             assert isinstance(api_exception.__cause__, ConnectionError)
 
             # Verify it can be raised and caught
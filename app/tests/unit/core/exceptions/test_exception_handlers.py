@@ -1,7 +1,9 @@
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import Mock
 
 import pytest
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 from app.src.core.exceptions.base_exceptions import BaseAPIException
@@ -10,6 +12,94 @@ from app.src.core.exceptions.exception_handlers import (
     _add_error_schemas_to_openapi,
     setup_exception_handlers,
 )
+from app.tests.framework.infrastructure.exception_handlers import (
+    register_handlers_on,
+)
+
+# monkeypatch targets
+_MOD = "app.src.core.exceptions.exception_handlers"
+_P_ADD_SCHEMAS = f"{_MOD}._add_error_schemas_to_openapi"
+_P_ADD_RESPONSES = f"{_MOD}._add_error_responses_to_endpoint"
+_P_LOGGER = f"{_MOD}.logger"
+_P_GET_REQUEST_ID = f"{_MOD}.get_request_id"
+_P_CREATE_API_ERROR_RESPONSE = f"{_MOD}.create_api_error_response"
+_SCHEMAS_MOD = "app.src.core.exceptions.exception_schemas"
+_P_VALIDATION_RESPONSE = f"{_SCHEMAS_MOD}.ValidationErrorResponse"
+_P_SERVER_RESPONSE = f"{_SCHEMAS_MOD}.ServerErrorResponse"
+# Imported at call time by the OpenAPI generator, so patched at its source
+_P_GET_OPENAPI = "fastapi.openapi.utils.get_openapi"
+
+# Attribute names of FastAPI, computed once; a class spec is re-walked on every Mock
+_FASTAPI_SPEC = dir(FastAPI)
+
+# Exceptions are built once: the handlers only read them, and the general
+# handler dispatches on isinstance, so a duck-typed stub would not do
+_API_EXCEPTION = BaseAPIException(
+    message="Test error message", status_code=400, detail="Test error detail"
+)
+# What the API handler logs for _API_EXCEPTION on a GET to /test/path
+_API_EXPECTED_MESSAGE = f"API exception: {_API_EXCEPTION.message}"
+_API_EXPECTED_EXTRA = {
+    "request_id": "test-request-id",
+    "exception_type": "BaseAPIException",
+    "path": "/test/path",
+    "method": "GET",
+    "status_code": 400,
+}
+_STATUS_CASES = [
+    (400, "Bad Request"),
+    (401, "Unauthorized"),
+    (403, "Forbidden"),
+    (404, "Not Found"),
+    (422, "Unprocessable Entity"),
+]
+
+
+def _make_request(path: str, method: str) -> SimpleNamespace:
+    """Build a request double exposing only what the handlers read."""
+    return SimpleNamespace(url=SimpleNamespace(path=path), method=method)
+
+
+@pytest.fixture(scope="module", params=_STATUS_CASES, ids=lambda case: str(case[0]))
+def status_exc(request):
+    """One BaseAPIException per status code, built once for the module."""
+    status_code, message = request.param
+    return BaseAPIException(message, status_code=status_code)
+
+
+@pytest.fixture
+def empty_openapi_app():
+    """Mock app with no cached schema, wrapped by _add_error_schemas_to_openapi."""
+    app = Mock(spec=_FASTAPI_SPEC)
+    app.openapi_schema = None
+    app.title = "Test API"
+    app.version = "1.0.0"
+    app.description = "Test Description"
+    app.routes = []
+    _add_error_schemas_to_openapi(app)
+    return app
+
+
+class _HandlerDeps(NamedTuple):
+    log: Mock
+    request_id_getter: Mock
+    build_api_error_response: Mock
+    build_server_error_response: Mock
+
+
+@pytest.fixture
+def handler_deps():
+    """Fresh fakes injected into the handlers in place of the real ones."""
+    deps = _HandlerDeps(Mock(), Mock(), Mock(), Mock())
+    # DEBUG is off unless a test enables it; a bare Mock would answer truthy
+    deps.log.isEnabledFor.return_value = False
+    return deps
+
+
+@pytest.fixture
+def handlers(handler_deps):
+    """Register the exception handlers on a mock app, keyed by type."""
+    return register_handlers_on(Mock(spec=_FASTAPI_SPEC), **handler_deps._asdict())
 
 
 class TestSetupExceptionHandlers:
@@ -17,7 +107,7 @@ class TestSetupExceptionHandlers:
 
     def test_setup_exception_handlers_registers_handlers(self):
         """Test that setup_exception_handlers registers exception handlers."""
-        mock_app = Mock(spec=FastAPI)
+        mock_app = Mock(spec=_FASTAPI_SPEC)
         mock_app.exception_handler = Mock(return_value=lambda f: f)
 
         setup_exception_handlers(mock_app)
@@ -30,16 +120,35 @@ class TestSetupExceptionHandlers:
         assert BaseAPIException in call_args
         assert Exception in call_args
 
-    def test_setup_exception_handlers_calls_openapi_enhancement(self):
+    def test_setup_exception_handlers_calls_openapi_enhancement(self, monkeypatch):
         """Test that setup_exception_handlers enhances OpenAPI schemas."""
-        mock_app = Mock(spec=FastAPI)
+        mock_app = Mock(spec=_FASTAPI_SPEC)
         mock_app.exception_handler = Mock(return_value=lambda f: f)
+        mock_add_schemas = Mock()
+        monkeypatch.setattr(_P_ADD_SCHEMAS, mock_add_schemas)
+
+        setup_exception_handlers(mock_app)
+
+        mock_add_schemas.assert_called_once_with(mock_app)
+
+    async def test_default_dependencies_follow_patched_module_logger(self, monkeypatch):
+        """Test that handlers set up without overrides use the patched logger."""
+        default_handlers = register_handlers_on(Mock(spec=_FASTAPI_SPEC))
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+        monkeypatch.setattr(_P_LOGGER, mock_logger)
+        monkeypatch.setattr(_P_GET_REQUEST_ID, Mock(return_value="patched-id"))
+        monkeypatch.setattr(
+            _P_CREATE_API_ERROR_RESPONSE, Mock(return_value={"error": "patched"})
+        )
 
-        with patch(
-            "app.src.core.exceptions.exception_handlers._add_error_schemas_to_openapi"
-        ) as mock_add_schemas:
-            setup_exception_handlers(mock_app)
-            mock_add_schemas.assert_called_once_with(mock_app)
+        await default_handlers[BaseAPIException](
+            _make_request("/test/path", "GET"), _API_EXCEPTION
+        )
+
+        mock_logger.warning.assert_called_once()
+        extra = mock_logger.warning.call_args.kwargs["extra"]
+        assert extra["request_id"] == "patched-id"
 
 
 class TestAPIExceptionHandler:
@@ -48,195 +157,83 @@ class TestAPIExceptionHandler:
     @pytest.fixture
     def mock_request(self):
         """Create a mock FastAPI request."""
-        request = Mock(spec=Request)
-        request.url.path = "/test/path"
-        request.method = "GET"
-        return request
+        return _make_request("/test/path", "GET")
 
     @pytest.fixture
     def mock_exception(self):
-        """Create a mock BaseAPIException."""
-        return BaseAPIException(
-            message="Test error message", status_code=400, detail="Test error detail"
-        )
+        """Return the shared BaseAPIException; handlers only read it."""
+        return _API_EXCEPTION
 
-    @pytest.mark.asyncio
     async def test_api_exception_handler_basic_functionality(
-        self, mock_request, mock_exception
+        self, mock_request, mock_exception, handlers, handler_deps
     ):
         """Test basic API exception handler functionality."""
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
-
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
-
-            return decorator
-
-        mock_app.exception_handler = register_handler
-
-        # Setup the handlers
-        setup_exception_handlers(mock_app)
-
         # Get the registered handler function
-        api_handler = handler_registry[BaseAPIException]
+        api_handler = handlers[BaseAPIException]
 
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers.create_api_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "test-request-id"
-            mock_create_response.return_value = {"error": "test response"}
+        handler_deps.request_id_getter.return_value = "test-request-id"
+        handler_deps.build_api_error_response.return_value = {"error": "test response"}
 
-            result = await api_handler(mock_request, mock_exception)
+        result = await api_handler(mock_request, mock_exception)
 
-            # Verify logging was called
-            mock_logger.warning.assert_called_once()
+        # Verify logging was called
+        handler_deps.log.warning.assert_called_once()
 
-            # Verify response creation was called
-            mock_create_response.assert_called_once_with(mock_exception, mock_request)
+        # Verify response creation was called
+        handler_deps.build_api_error_response.assert_called_once_with(
+            mock_exception, mock_request
+        )
 
-            # Verify JSONResponse creation
-            assert isinstance(result, JSONResponse)
-            assert result.status_code == 400
+        # Verify JSONResponse creation
+        assert isinstance(result, JSONResponse)
+        assert result.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_api_exception_handler_logging_details(
-        self, mock_request, mock_exception
+        self, mock_request, mock_exception, handlers, handler_deps
     ):
         """Test that API exception handler logs correct details."""
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
+        api_handler = handlers[BaseAPIException]
 
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
+        handler_deps.request_id_getter.return_value = "test-request-id"
+        handler_deps.build_api_error_response.return_value = {"error": "test response"}
 
-            return decorator
+        await api_handler(mock_request, mock_exception)
 
-        mock_app.exception_handler = register_handler
+        # Verify logging call details
+        handler_deps.log.warning.assert_called_once_with(
+            _API_EXPECTED_MESSAGE, extra=_API_EXPECTED_EXTRA, exc_info=None
+        )
 
-        setup_exception_handlers(mock_app)
-        api_handler = handler_registry[BaseAPIException]
-
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers.create_api_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "test-request-id"
-            mock_create_response.return_value = {"error": "test response"}
-            mock_logger.isEnabledFor.return_value = False
-
-            await api_handler(mock_request, mock_exception)
-
-            # Verify logging call details
-            mock_logger.warning.assert_called_once_with(
-                f"API exception: {mock_exception.message}",
-                extra={
-                    "request_id": "test-request-id",
-                    "exception_type": "BaseAPIException",
-                    "path": "/test/path",
-                    "method": "GET",
-                    "status_code": 400,
-                },
-                exc_info=None,
-            )
-
-    @pytest.mark.asyncio
     async def test_api_exception_handler_debug_logging(
-        self, mock_request, mock_exception
+        self, mock_request, mock_exception, handlers, handler_deps
     ):
         """
         Test that API exception handler includes exc_info when debug logging is enabled.
         """
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
+        api_handler = handlers[BaseAPIException]
 
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
+        handler_deps.request_id_getter.return_value = "test-request-id"
+        handler_deps.build_api_error_response.return_value = {"error": "test response"}
+        handler_deps.log.isEnabledFor.return_value = True  # Enable debug logging
 
-            return decorator
+        await api_handler(mock_request, mock_exception)
 
-        mock_app.exception_handler = register_handler
+        # Verify exc_info is included when debug is enabled
+        call_args = handler_deps.log.warning.call_args
+        assert call_args[1]["exc_info"] is mock_exception
 
-        setup_exception_handlers(mock_app)
-        api_handler = handler_registry[BaseAPIException]
-
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers.create_api_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "test-request-id"
-            mock_create_response.return_value = {"error": "test response"}
-            mock_logger.isEnabledFor.return_value = True  # Enable debug logging
-
-            await api_handler(mock_request, mock_exception)
-
-            # Verify exc_info is included when debug is enabled
-            call_args = mock_logger.warning.call_args
-            assert call_args[1]["exc_info"] is mock_exception
-
-    @pytest.mark.asyncio
-    async def test_api_exception_handler_different_status_codes(self, mock_request):
+    async def test_api_exception_handler_different_status_codes(
+        self, mock_request, handlers, handler_deps, status_exc
+    ):
         """Test API exception handler with different status codes."""
-        test_cases = [
-            (400, "Bad Request"),
-            (401, "Unauthorized"),
-            (403, "Forbidden"),
-            (404, "Not Found"),
-            (422, "Unprocessable Entity"),
-        ]
-
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
-
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
-
-            return decorator
-
-        mock_app.exception_handler = register_handler
-        setup_exception_handlers(mock_app)
-        api_handler = handler_registry[BaseAPIException]
-
-        for status_code, message in test_cases:
-            exception = BaseAPIException(message, status_code=status_code)
-
-            with (
-                patch("app.src.core.exceptions.exception_handlers.logger"),
-                patch("app.src.core.exceptions.exception_handlers.get_request_id"),
-                patch(
-                    "app.src.core.exceptions.exception_handlers."
-                    "create_api_error_response"
-                ) as mock_create_response,
-            ):
-                mock_create_response.return_value = {"error": message}
+        api_handler = handlers[BaseAPIException]
+        handler_deps.build_api_error_response.return_value = {
+            "error": status_exc.message
+        }
 
-                result = await api_handler(mock_request, exception)
+        result = await api_handler(mock_request, status_exc)
 
-                assert result.status_code == status_code
+        assert result.status_code == status_exc.status_code
 
 
 class TestGeneralExceptionHandler:
@@ -245,161 +242,95 @@ class TestGeneralExceptionHandler:
     @pytest.fixture
     def mock_request(self):
         """Create a mock FastAPI request."""
-        request = Mock(spec=Request)
-        request.url.path = "/test/path"
-        request.method = "POST"
-        return request
+        return _make_request("/test/path", "POST")
 
-    @pytest.mark.asyncio
-    async def test_general_exception_handler_with_non_api_exception(self, mock_request):
+    async def test_general_exception_handler_with_non_api_exception(
+        self, mock_request, handlers, handler_deps
+    ):
         """Test general exception handler with non-BaseAPIException."""
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
+        general_handler = handlers[Exception]
 
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
-
-            return decorator
+        test_exception = ValueError("Test value error")
 
-        mock_app.exception_handler = register_handler
-        setup_exception_handlers(mock_app)
-        general_handler = handler_registry[Exception]
+        handler_deps.request_id_getter.return_value = "test-request-id"
+        handler_deps.build_server_error_response.return_value = {
+            "error": "Internal server error"
+        }
 
-        test_exception = ValueError("Test value error")
+        result = await general_handler(mock_request, test_exception)
+
+        # Verify error logging
+        assert handler_deps.log.error.call_count == 1
+        log_call = handler_deps.log.error.call_args
+        assert log_call.args == ("Unhandled exception occurred",)
+        assert log_call.kwargs["exc_info"] is test_exception
+        extra = log_call.kwargs["extra"]
+        assert extra["request_id"] == "test-request-id"
+        assert extra["exception_type"] == "ValueError"
+        assert extra["path"] == "/test/path"
+        assert extra["method"] == "POST"
+
+        # Verify response
+        assert isinstance(result, JSONResponse)
+        assert result.status_code == 500
+        handler_deps.build_server_error_response.assert_called_once_with(
+            test_exception, mock_request
+        )
 
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers."
-                "create_server_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "test-request-id"
-            mock_create_response.return_value = {"error": "Internal server error"}
-
-            result = await general_handler(mock_request, test_exception)
-
-            # Verify error logging
-            mock_logger.error.assert_called_once_with(
-                "Unhandled exception occurred",
-                extra={
-                    "request_id": "test-request-id",
-                    "exception_type": "ValueError",
-                    "path": "/test/path",
-                    "method": "POST",
-                },
-                exc_info=test_exception,
-            )
-
-            # Verify response
-            assert isinstance(result, JSONResponse)
-            assert result.status_code == 500
-            mock_create_response.assert_called_once_with(test_exception, mock_request)
-
-    @pytest.mark.asyncio
     async def test_general_exception_handler_delegates_base_api_exception(
-        self, mock_request
+        self, mock_request, handlers, handler_deps
     ):
         """Test that general handler delegates BaseAPIException to API handler."""
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
 
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
+        general_handler = handlers[Exception]
 
-            return decorator
+        base_api_exception = BaseAPIException("Test API error", status_code=422)
 
-        mock_app.exception_handler = register_handler
-        setup_exception_handlers(mock_app)
+        handler_deps.request_id_getter.return_value = "test-request-id"
+        handler_deps.build_api_error_response.return_value = {"error": "test response"}
 
-        general_handler = handler_registry[Exception]
+        result = await general_handler(mock_request, base_api_exception)
 
-        base_api_exception = BaseAPIException("Test API error", status_code=422)
+        # Verify delegation occurred by checking the result is a
+        # JSONResponse with 422 status
+        assert isinstance(result, JSONResponse)
+        assert result.status_code == 422
 
-        # Mock the necessary dependencies for the api handler
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers.create_api_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "test-request-id"
-            mock_create_response.return_value = {"error": "test response"}
-
-            result = await general_handler(mock_request, base_api_exception)
-
-            # Verify delegation occurred by checking the result is a
-            # JSONResponse with 422 status
-            assert isinstance(result, JSONResponse)
-            assert result.status_code == 422
-
-            # Verify the API handler was called (indirectly through logging)
-            mock_logger.warning.assert_called_once()
-            mock_create_response.assert_called_once_with(
-                base_api_exception, mock_request
-            )
-
-    @pytest.mark.asyncio
-    async def test_general_exception_handler_different_exception_types(
-        self, mock_request
-    ):
-        """Test general exception handler with various exception types."""
-        exception_types = [
+        # Verify the API handler was called (indirectly through logging)
+        handler_deps.log.warning.assert_called_once()
+        handler_deps.build_api_error_response.assert_called_once_with(
+            base_api_exception, mock_request
+        )
+
+    @pytest.mark.parametrize(
+        "exception",
+        [
             ValueError("Value error"),
             TypeError("Type error"),
             RuntimeError("Runtime error"),
             KeyError("Key error"),
             AttributeError("Attribute error"),
-        ]
+        ],
+        ids=lambda exc: type(exc).__name__,
+    )
+    async def test_general_exception_handler_different_exception_types(
+        self, mock_request, handlers, handler_deps, exception
+    ):
+        """Test general exception handler with various exception types."""
+        general_handler = handlers[Exception]
+        handler_deps.build_server_error_response.return_value = {
+            "error": "Server error"
+        }
 
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
+        result = await general_handler(mock_request, exception)
 
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
+        # Verify logging includes correct exception type
+        call_args = handler_deps.log.error.call_args
+        assert call_args[1]["extra"]["exception_type"] == type(exception).__name__
+        assert call_args[1]["exc_info"] is exception
 
-            return decorator
-
-        mock_app.exception_handler = register_handler
-        setup_exception_handlers(mock_app)
-        general_handler = handler_registry[Exception]
-
-        for exception in exception_types:
-            with (
-                patch(
-                    "app.src.core.exceptions.exception_handlers.logger"
-                ) as mock_logger,
-                patch("app.src.core.exceptions.exception_handlers.get_request_id"),
-                patch(
-                    "app.src.core.exceptions.exception_handlers."
-                    "create_server_error_response"
-                ) as mock_create_response,
-            ):
-                mock_create_response.return_value = {"error": "Server error"}
-
-                result = await general_handler(mock_request, exception)
-
-                # Verify logging includes correct exception type
-                call_args = mock_logger.error.call_args
-                assert (
-                    call_args[1]["extra"]["exception_type"] == type(exception).__name__
-                )
-                assert call_args[1]["exc_info"] is exception
-
-                # All unhandled exceptions return 500
-                assert result.status_code == 500
+        # All unhandled exceptions return 500
+        assert result.status_code == 500
 
 
 class TestOpenAPIEnhancement:
@@ -407,7 +338,7 @@ class TestOpenAPIEnhancement:
 
     def test_add_error_schemas_to_openapi_sets_custom_generator(self):
         """Test that _add_error_schemas_to_openapi sets a custom openapi generator."""
-        mock_app = Mock(spec=FastAPI)
+        mock_app = Mock(spec=_FASTAPI_SPEC)
         mock_app.openapi = None
 
         _add_error_schemas_to_openapi(mock_app)
@@ -417,7 +348,7 @@ class TestOpenAPIEnhancement:
 
     def test_add_error_schemas_to_openapi_caches_schema(self):
         """Test that the enhanced OpenAPI generator caches the schema."""
-        mock_app = Mock(spec=FastAPI)
+        mock_app = Mock(spec=_FASTAPI_SPEC)
         mock_app.openapi_schema = {"existing": "schema"}
         mock_app.title = "Test API"
         mock_app.version = "1.0.0"
@@ -432,81 +363,68 @@ class TestOpenAPIEnhancement:
         # Should return the cached schema
         assert result == {"existing": "schema"}
 
-    def test_add_error_schemas_to_openapi_generates_new_schema(self):
+    def test_add_error_schemas_to_openapi_generates_new_schema(
+        self, monkeypatch, empty_openapi_app
+    ):
         """
         Test that the enhanced OpenAPI generator creates new schema when none exists.
         """
-        mock_app = Mock(spec=FastAPI)
-        mock_app.openapi_schema = None
-        mock_app.title = "Test API"
-        mock_app.version = "1.0.0"
-        mock_app.description = "Test Description"
-        mock_app.routes = []
-
-        _add_error_schemas_to_openapi(mock_app)
-
-        # Mock the import that happens inside the enhanced_openapi_generator
-        with patch("fastapi.openapi.utils.get_openapi") as mock_get_openapi:
-            mock_openapi_schema = {
-                "paths": {
-                    "/test": {"get": {"responses": {"200": {"description": "Success"}}}}
-                }
+        mock_openapi_schema = {
+            "paths": {
+                "/test": {"get": {"responses": {"200": {"description": "Success"}}}}
             }
-            mock_get_openapi.return_value = mock_openapi_schema
-
-            with patch(
-                "app.src.core.exceptions.exception_handlers."
-                "_add_error_responses_to_endpoint"
-            ) as mock_add_responses:
-                mock_app.openapi()
-
-                # Verify get_openapi was called
-                mock_get_openapi.assert_called_once_with(
-                    title="Test API",
-                    version="1.0.0",
-                    description="Test Description",
-                    routes=[],
-                )
+        }
+        # get_openapi is imported inside the enhanced_openapi_generator
+        mock_get_openapi = Mock(return_value=mock_openapi_schema)
+        monkeypatch.setattr(_P_GET_OPENAPI, mock_get_openapi)
+        mock_add_responses = Mock()
+        monkeypatch.setattr(_P_ADD_RESPONSES, mock_add_responses)
+
+        empty_openapi_app.openapi()
+
+        # Verify get_openapi was called
+        mock_get_openapi.assert_called_once_with(
+            title="Test API",
+            version="1.0.0",
+            description="Test Description",
+            routes=[],
+        )
 
-                # Verify error responses were added
-                mock_add_responses.assert_called_once()
+        # Verify error responses were added
+        mock_add_responses.assert_called_once()
 
-                # Verify schema was cached
-                assert mock_app.openapi_schema == mock_openapi_schema
+        # Verify schema was cached
+        assert empty_openapi_app.openapi_schema == mock_openapi_schema
 
-    def test_add_error_responses_to_endpoint_adds_missing_responses(self):
+    def test_add_error_responses_to_endpoint_adds_missing_responses(self, monkeypatch):
         """Test that _add_error_responses_to_endpoint adds missing error responses."""
         responses = {"200": {"description": "Success"}}
 
-        # Mock the import that happens inside _add_error_responses_to_endpoint
-        with (
-            patch(
-                "app.src.core.exceptions.exception_schemas.ValidationErrorResponse"
-            ) as mock_validation_response,
-            patch(
-                "app.src.core.exceptions.exception_schemas.ServerErrorResponse"
-            ) as mock_server_response,
-        ):
-            mock_validation_response.model_json_schema.return_value = {
-                "validation": "schema"
-            }
-            mock_server_response.model_json_schema.return_value = {"server": "schema"}
+        # The schema models are imported inside _add_error_responses_to_endpoint
+        mock_validation_response = Mock()
+        mock_validation_response.model_json_schema.return_value = {
+            "validation": "schema"
+        }
+        mock_server_response = Mock()
+        mock_server_response.model_json_schema.return_value = {"server": "schema"}
+        monkeypatch.setattr(_P_VALIDATION_RESPONSE, mock_validation_response)
+        monkeypatch.setattr(_P_SERVER_RESPONSE, mock_server_response)
 
-            _add_error_responses_to_endpoint(responses)
+        _add_error_responses_to_endpoint(responses)
 
-            # Verify 400 response was added
-            assert "400" in responses
-            assert responses["400"]["description"] == "Bad Request"
-            assert responses["400"]["content"]["application/json"]["schema"] == {
-                "validation": "schema"
-            }
+        # Verify 400 response was added
+        assert "400" in responses
+        assert responses["400"]["description"] == "Bad Request"
+        assert responses["400"]["content"]["application/json"]["schema"] == {
+            "validation": "schema"
+        }
 
-            # Verify 500 response was added
-            assert "500" in responses
-            assert responses["500"]["description"] == "Internal Server Error"
-            assert responses["500"]["content"]["application/json"]["schema"] == {
-                "server": "schema"
-            }
+        # Verify 500 response was added
+        assert "500" in responses
+        assert responses["500"]["description"] == "Internal Server Error"
+        assert responses["500"]["content"]["application/json"]["schema"] == {
+            "server": "schema"
+        }
 
     def test_add_error_responses_to_endpoint_preserves_existing_responses(self):
         """
@@ -517,239 +435,154 @@ class TestOpenAPIEnhancement:
             "400": {"description": "Custom Bad Request"},
             "500": {"description": "Custom Server Error"},
         }
-        original_responses = responses.copy()
 
         _add_error_responses_to_endpoint(responses)
 
         # Verify existing responses were not modified
-        assert responses["400"] == original_responses["400"]
-        assert responses["500"] == original_responses["500"]
-        assert responses["200"] == original_responses["200"]
+        assert responses == {
+            "200": {"description": "Success"},
+            "400": {"description": "Custom Bad Request"},
+            "500": {"description": "Custom Server Error"},
+        }
 
-    def test_add_error_responses_to_endpoint_partial_existing_responses(self):
+    def test_add_error_responses_to_endpoint_partial_existing_responses(
+        self, monkeypatch
+    ):
         """Test adding responses when only some error responses exist."""
         responses = {
             "200": {"description": "Success"},
             "400": {"description": "Existing Bad Request"},
         }
 
-        with patch(
-            "app.src.core.exceptions.exception_schemas.ServerErrorResponse"
-        ) as mock_server_response:
-            mock_server_response.model_json_schema.return_value = {"server": "schema"}
+        mock_server_response = Mock()
+        mock_server_response.model_json_schema.return_value = {"server": "schema"}
+        monkeypatch.setattr(_P_SERVER_RESPONSE, mock_server_response)
 
-            _add_error_responses_to_endpoint(responses)
+        _add_error_responses_to_endpoint(responses)
 
-            # Verify 400 was not modified
-            assert responses["400"]["description"] == "Existing Bad Request"
+        # Verify 400 was not modified
+        assert responses["400"]["description"] == "Existing Bad Request"
 
-            # Verify 500 was added
-            assert "500" in responses
-            assert responses["500"]["description"] == "Internal Server Error"
+        # Verify 500 was added
+        assert "500" in responses
+        assert responses["500"]["description"] == "Internal Server Error"
 
 
+@pytest.mark.integration
 class TestIntegrationScenarios:
     """Test integration scenarios for exception handlers."""
 
-    @pytest.fixture
-    def mock_app_with_handlers(self):
-        """Create a mock FastAPI app with handlers set up."""
-        app = Mock(spec=FastAPI)
-        handlers = {}
-
-        def exception_handler(exc_type):
-            def decorator(handler_func):
-                handlers[exc_type] = handler_func
-                return handler_func
-
-            return decorator
-
-        app.exception_handler = exception_handler
-        app.handlers = handlers  # Store for test access
-
-        setup_exception_handlers(app)
-        return app
-
-    @pytest.mark.asyncio
-    async def test_complete_api_exception_flow(self, mock_app_with_handlers):
+    async def test_complete_api_exception_flow(self, handlers, handler_deps):
         """Test complete flow for API exception handling."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/api/test"
-        mock_request.method = "PUT"
+        mock_request = _make_request("/api/test", "PUT")
 
         exception = BaseAPIException(
             message="Validation failed", status_code=422, detail="Invalid input data"
         )
 
-        handler = mock_app_with_handlers.handlers[BaseAPIException]
-
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers.create_api_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "integration-test-id"
-            mock_create_response.return_value = {
-                "error": "Validation failed",
-                "detail": "Invalid input data",
-            }
+        handler = handlers[BaseAPIException]
+
+        handler_deps.request_id_getter.return_value = "integration-test-id"
+        handler_deps.build_api_error_response.return_value = {
+            "error": "Validation failed",
+            "detail": "Invalid input data",
+        }
 
-            result = await handler(mock_request, exception)
+        result = await handler(mock_request, exception)
 
-            # Verify complete flow
-            assert isinstance(result, JSONResponse)
-            assert result.status_code == 422
+        # Verify complete flow
+        assert isinstance(result, JSONResponse)
+        assert result.status_code == 422
 
-            # Verify logging
-            mock_logger.warning.assert_called_once()
-            log_call = mock_logger.warning.call_args
-            assert "Validation failed" in log_call[0][0]
-            assert log_call[1]["extra"]["request_id"] == "integration-test-id"
-            assert log_call[1]["extra"]["method"] == "PUT"
-            assert log_call[1]["extra"]["path"] == "/api/test"
+        # Verify logging
+        handler_deps.log.warning.assert_called_once()
+        log_call = handler_deps.log.warning.call_args
+        assert "Validation failed" in log_call[0][0]
+        assert log_call[1]["extra"]["request_id"] == "integration-test-id"
+        assert log_call[1]["extra"]["method"] == "PUT"
+        assert log_call[1]["extra"]["path"] == "/api/test"
 
-    @pytest.mark.asyncio
-    async def test_complete_general_exception_flow(self, mock_app_with_handlers):
+    async def test_complete_general_exception_flow(self, handlers, handler_deps):
         """Test complete flow for general exception handling."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/api/crash"
-        mock_request.method = "DELETE"
+        mock_request = _make_request("/api/crash", "DELETE")
 
         exception = RuntimeError("Database connection failed")
 
-        handler = mock_app_with_handlers.handlers[Exception]
-
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers."
-                "create_server_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = "crash-test-id"
-            mock_create_response.return_value = {
-                "error": "Internal server error",
-                "message": "An unexpected error occurred",
-            }
+        handler = handlers[Exception]
 
-            result = await handler(mock_request, exception)
+        handler_deps.request_id_getter.return_value = "crash-test-id"
+        handler_deps.build_server_error_response.return_value = {
+            "error": "Internal server error",
+            "message": "An unexpected error occurred",
+        }
+
+        result = await handler(mock_request, exception)
 
-            # Verify complete flow
-            assert isinstance(result, JSONResponse)
-            assert result.status_code == 500
+        # Verify complete flow
+        assert isinstance(result, JSONResponse)
+        assert result.status_code == 500
 
-            # Verify error logging
-            mock_logger.error.assert_called_once()
-            log_call = mock_logger.error.call_args
-            assert "Unhandled exception occurred" in log_call[0][0]
-            assert log_call[1]["extra"]["request_id"] == "crash-test-id"
-            assert log_call[1]["extra"]["exception_type"] == "RuntimeError"
-            assert log_call[1]["exc_info"] is exception
+        # Verify error logging
+        handler_deps.log.error.assert_called_once()
+        log_call = handler_deps.log.error.call_args
+        assert "Unhandled exception occurred" in log_call[0][0]
+        assert log_call[1]["extra"]["request_id"] == "crash-test-id"
+        assert log_call[1]["extra"]["exception_type"] == "RuntimeError"
+        assert log_call[1]["exc_info"] is exception
 
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    @pytest.mark.asyncio
-    async def test_handler_with_missing_request_id(self):
+    async def test_handler_with_missing_request_id(self, handlers, handler_deps):
         """Test handler behavior when request_id is not available."""
-        mock_app = Mock(spec=FastAPI)
-        handler_registry = {}
-
-        def register_handler(exc_type):
-            def decorator(handler_func):
-                handler_registry[exc_type] = handler_func
-                return handler_func
-
-            return decorator
-
-        mock_app.exception_handler = register_handler
-        setup_exception_handlers(mock_app)
-
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
+        mock_request = _make_request("/test", "GET")
 
         exception = BaseAPIException("Test error")
 
-        handler = handler_registry[BaseAPIException]
+        handler = handlers[BaseAPIException]
 
-        with (
-            patch("app.src.core.exceptions.exception_handlers.logger") as mock_logger,
-            patch(
-                "app.src.core.exceptions.exception_handlers.get_request_id"
-            ) as mock_get_request_id,
-            patch(
-                "app.src.core.exceptions.exception_handlers.create_api_error_response"
-            ) as mock_create_response,
-        ):
-            mock_get_request_id.return_value = None  # No request ID available
-            mock_create_response.return_value = {"error": "test"}
+        handler_deps.request_id_getter.return_value = None  # No request ID available
+        handler_deps.build_api_error_response.return_value = {"error": "test"}
 
-            result = await handler(mock_request, exception)
+        result = await handler(mock_request, exception)
 
-            # Verify it still works
-            assert isinstance(result, JSONResponse)
+        # Verify it still works
+        assert isinstance(result, JSONResponse)
 
-            # Verify logging includes None request_id
-            log_call = mock_logger.warning.call_args
-            assert log_call[1]["extra"]["request_id"] is None
+        # Verify logging includes None request_id
+        log_call = handler_deps.log.warning.call_args
+        assert log_call[1]["extra"]["request_id"] is None
 
-    def test_openapi_enhancement_with_empty_paths(self):
+    def test_openapi_enhancement_with_empty_paths(self, monkeypatch, empty_openapi_app):
         """Test OpenAPI enhancement when no paths exist."""
-        mock_app = Mock(spec=FastAPI)
-        mock_app.openapi_schema = None
-        mock_app.title = "Test API"
-        mock_app.version = "1.0.0"
-        mock_app.description = "Test Description"
-        mock_app.routes = []
-
-        _add_error_schemas_to_openapi(mock_app)
-
-        with patch("fastapi.openapi.utils.get_openapi") as mock_get_openapi:
-            mock_get_openapi.return_value = {"paths": {}}
+        monkeypatch.setattr(_P_GET_OPENAPI, Mock(return_value={"paths": {}}))
 
-            # Should not raise any errors
-            result = mock_app.openapi()
-            assert "paths" in result
+        # Should not raise any errors
+        result = empty_openapi_app.openapi()
+        assert "paths" in result
 
-    def test_openapi_enhancement_with_malformed_paths(self):
+    def test_openapi_enhancement_with_malformed_paths(
+        self, monkeypatch, empty_openapi_app
+    ):
         """Test OpenAPI enhancement with malformed path data."""
-        mock_app = Mock(spec=FastAPI)
-        mock_app.openapi_schema = None
-        mock_app.title = "Test API"
-        mock_app.version = "1.0.0"
-        mock_app.description = "Test Description"
-        mock_app.routes = []
-
-        _add_error_schemas_to_openapi(mock_app)
-
-        with patch("fastapi.openapi.utils.get_openapi") as mock_get_openapi:
-            # Malformed paths - some entries are not dicts
-            mock_get_openapi.return_value = {
-                "paths": {
-                    "/test1": {
-                        "get": "not a dict",  # This should be skipped
-                        "post": {"responses": {}},  # This should be processed
-                    }
+        # Malformed paths - some entries are not dicts
+        malformed_schema = {
+            "paths": {
+                "/test1": {
+                    "get": "not a dict",  # This should be skipped
+                    "post": {"responses": {}},  # This should be processed
                 }
             }
+        }
+        monkeypatch.setattr(_P_GET_OPENAPI, Mock(return_value=malformed_schema))
+        mock_add_responses = Mock()
+        monkeypatch.setattr(_P_ADD_RESPONSES, mock_add_responses)
 
-            with patch(
-                "app.src.core.exceptions.exception_handlers."
-                "_add_error_responses_to_endpoint"
-            ) as mock_add_responses:
-                mock_app.openapi()
+        empty_openapi_app.openapi()
 
-                # Should only be called once for the valid method
-                mock_add_responses.assert_called_once()
+        # Should only be called once for the valid method
+        mock_add_responses.assert_called_once()
 
 
 if __name__ == "__main__":
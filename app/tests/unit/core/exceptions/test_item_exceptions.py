@@ -9,21 +9,164 @@ from app.src.core.exceptions.item_exceptions import (
     ItemStateTransitionError,
     ItemValidationError,
 )
+from app.tests.framework import assert_attrs
+
+# Keep the module on one xdist worker so its module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("item_exceptions")
+
+# Messages and details the item exceptions produce, shared by several cases
+_NOT_FOUND_MESSAGE = "Requested item not found"
+_NOT_FOUND_DETAIL = (
+    "The item may have been moved, deleted, or you may not have access to it"
+)
+_VALIDATION_DETAIL = "Check item for missing fields"
+_EMAIL_FIELD_DETAIL = "Validation failed for field: email"
+_DATE_MESSAGE = "Date format is invalid"
+_STATE_MESSAGE = "Invalid state transition attempted"
+_STATE_DETAIL = "Check the current state and allowed transitions for this item type"
+_CONFLICT_DETAIL = "Resolve the conflict and try again"
+
+# Never raised: BaseAPIException assigns __cause__ directly, so chaining needs
+# no active except block and the instance stays traceback-free
+_ORIGINAL_ERR = ValueError("Database connection failed")
+
+# Constructor kwargs -> generated message, per exception with smart messages
+_NOT_FOUND_MESSAGE_CASES = [
+    pytest.param({}, _NOT_FOUND_MESSAGE, id="defaults"),
+    pytest.param(
+        {"item_type": "task", "item_id": "123"}, "Task '123' not found", id="task"
+    ),
+    pytest.param(
+        {"item_type": "user", "item_id": "abc-def"},
+        "User 'abc-def' not found",
+        id="item_type_title_cased",
+    ),
+    pytest.param({"item_type": "project"}, _NOT_FOUND_MESSAGE, id="item_type_only"),
+    pytest.param({"item_id": "999"}, _NOT_FOUND_MESSAGE, id="item_id_only"),
+    pytest.param(
+        {"message": "Explicit message", "item_type": "task", "item_id": "123"},
+        "Explicit message",
+        id="explicit_message_wins",
+    ),
+]
+_DATE_MESSAGE_CASES = [
+    pytest.param({}, _DATE_MESSAGE, id="defaults"),
+    pytest.param(
+        {"date_string": "invalid-date"},
+        "Invalid date format: 'invalid-date'",
+        id="date_string",
+    ),
+    pytest.param(
+        {"message": "Explicit date error", "date_string": "bad-date"},
+        "Explicit date error",
+        id="explicit_message_wins",
+    ),
+]
+_STATE_MESSAGE_CASES = [
+    pytest.param({}, _STATE_MESSAGE, id="defaults"),
+    pytest.param(
+        {
+            "item_type": "task",
+            "current_state": "completed",
+            "attempted_action": "delete",
+        },
+        "Cannot delete task in completed state",
+        id="full_state_info",
+    ),
+    pytest.param(
+        {"item_type": "document", "current_state": "draft"},
+        _STATE_MESSAGE,
+        id="missing_attempted_action",
+    ),
+    pytest.param(
+        {"item_type": "task", "attempted_action": "archive"},
+        _STATE_MESSAGE,
+        id="missing_current_state",
+    ),
+    pytest.param(
+        {"current_state": "active", "attempted_action": "start"},
+        _STATE_MESSAGE,
+        id="missing_item_type",
+    ),
+    pytest.param(
+        {
+            "message": "Explicit state error",
+            "item_type": "project",
+            "current_state": "active",
+            "attempted_action": "start",
+        },
+        "Explicit state error",
+        id="explicit_message_wins",
+    ),
+]
+
+# ItemValidationError (detail, field, errors) -> resulting detail
+_DETAIL_RULES = [
+    pytest.param(None, None, None, _VALIDATION_DETAIL, id="default"),
+    pytest.param(None, None, [], _VALIDATION_DETAIL, id="empty_errors"),
+    pytest.param(None, "email", None, _EMAIL_FIELD_DETAIL, id="field"),
+    pytest.param(
+        None,
+        None,
+        ["e1", "e2", "e3"],
+        "Multiple validation errors: 3 fields",
+        id="errors",
+    ),
+    pytest.param("custom", None, None, "custom", id="custom_detail"),
+    pytest.param(
+        "custom",
+        "username",
+        None,
+        "Validation failed for field: username",
+        id="field_beats_detail",
+    ),
+    pytest.param(
+        "custom",
+        None,
+        ["e1", "e2"],
+        "Multiple validation errors: 2 fields",
+        id="errors_beat_detail",
+    ),
+    pytest.param(
+        None,
+        "priority_field",
+        ["e1", "e2"],
+        "Validation failed for field: priority_field",
+        id="field_beats_errors",
+    ),
+]
+
+# (child, parent) links of the item exception hierarchy. Subclass and
+# except-clause relationships are asserted only through this table; the
+# per-class tests cover construction and attribute values.
+_HIERARCHY = [
+    (BaseItemException, BaseAPIException),
+    (BaseAPIException, Exception),
+    (ItemNotFoundError, BaseItemException),
+    (ItemValidationError, BaseItemException),
+    (ItemDateParsingError, ItemValidationError),
+    (ItemStateTransitionError, ItemValidationError),
+    (ItemConflictError, BaseItemException),
+]
+
+# Expected status code per item exception; status_code is assigned in
+# __init__, not on the class, so each case builds one instance
+_STATUS_CODES = [
+    (ItemNotFoundError, 404),
+    (ItemValidationError, 400),
+    (ItemDateParsingError, 400),
+    (ItemStateTransitionError, 400),
+    (ItemConflictError, 409),
+]
 
 
 class TestBaseItemException:
     """Test BaseItemException class."""
 
-    def test_inherits_from_base_api_exception(self):
-        """Test that BaseItemException inherits from BaseAPIException."""
-        assert issubclass(BaseItemException, BaseAPIException)
-
     def test_can_be_instantiated(self):
         """Test that BaseItemException can be instantiated."""
         exception = BaseItemException("Test item exception")
 
-        assert isinstance(exception, BaseItemException)
-        assert isinstance(exception, BaseAPIException)
         assert exception.message == "Test item exception"
 
     def test_can_be_raised_and_caught(self):
@@ -33,590 +176,467 @@ class TestBaseItemException:
 
         assert exc_info.value.message == "Test raising"
 
-    def test_can_be_caught_as_base_api_exception(self):
-        """Test that BaseItemException can be caught as BaseAPIException."""
-        with pytest.raises(BaseAPIException) as exc_info:
-            raise BaseItemException("Test base catching")
-
-        assert isinstance(exc_info.value, BaseItemException)
-
 
 class TestItemNotFoundError:
     """Test ItemNotFoundError class."""
 
-    def test_inherits_from_base_item_exception(self):
-        """Test that ItemNotFoundError inherits from BaseItemException."""
-        assert issubclass(ItemNotFoundError, BaseItemException)
-        assert issubclass(ItemNotFoundError, BaseAPIException)
-
-    def test_constructor_with_explicit_message(self):
-        """Test creating exception with explicit message."""
-        exception = ItemNotFoundError("Custom not found message")
-
-        assert exception.message == "Custom not found message"
-        assert exception.status_code == 404
-        assert "may have been moved, deleted" in exception.detail
-        assert exception.item_type is None
-        assert exception.item_id is None
-
-    def test_constructor_with_item_type_and_id(self):
-        """Test creating exception with item_type and item_id for smart message."""
-        exception = ItemNotFoundError(item_type="task", item_id="123")
-
-        assert exception.message == "Task '123' not found"
-        assert exception.status_code == 404
-        assert exception.item_type == "task"
-        assert exception.item_id == "123"
-
-    def test_constructor_with_item_type_and_id_lowercase(self):
-        """Test that item_type is properly capitalized in message."""
-        exception = ItemNotFoundError(item_type="user", item_id="abc-def")
-
-        assert exception.message == "User 'abc-def' not found"
-        assert exception.item_type == "user"
-        assert exception.item_id == "abc-def"
-
-    def test_constructor_without_message_or_item_info(self):
-        """Test creating exception without message or item info uses default."""
-        exception = ItemNotFoundError()
-
-        assert exception.message == "Requested item not found"
-        assert exception.status_code == 404
-        assert exception.item_type is None
-        assert exception.item_id is None
-
-    def test_constructor_with_custom_detail(self):
-        """Test creating exception with custom detail."""
-        custom_detail = "This specific item was archived"
-        exception = ItemNotFoundError("Not found", detail=custom_detail)
-
-        assert exception.detail == custom_detail
-
-    def test_constructor_with_partial_item_info(self):
-        """Test creating exception with only item_type or only item_id."""
-        # Only item_type
-        exception1 = ItemNotFoundError(item_type="project")
-        assert exception1.message == "Requested item not found"
-        assert exception1.item_type == "project"
-        assert exception1.item_id is None
-
-        # Only item_id
-        exception2 = ItemNotFoundError(item_id="999")
-        assert exception2.message == "Requested item not found"
-        assert exception2.item_type is None
-        assert exception2.item_id == "999"
-
-    def test_constructor_explicit_message_overrides_smart_generation(self):
-        """Test that explicit message overrides smart generation."""
-        exception = ItemNotFoundError(
-            message="Explicit message", item_type="task", item_id="123"
-        )
-
-        assert exception.message == "Explicit message"
-        assert exception.item_type == "task"
-        assert exception.item_id == "123"
-
-    def test_all_parameters_together(self):
-        """Test creating exception with all parameters."""
-        exception = ItemNotFoundError(
-            message="Custom message",
-            detail="Custom detail",
-            item_type="document",
-            item_id="doc-456",
-        )
-
-        assert exception.message == "Custom message"
-        assert exception.detail == "Custom detail"
-        assert exception.status_code == 404
-        assert exception.item_type == "document"
-        assert exception.item_id == "doc-456"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"message": "Custom not found message"},
+                {
+                    "message": "Custom not found message",
+                    "status_code": 404,
+                    "detail": _NOT_FOUND_DETAIL,
+                    "item_type": None,
+                    "item_id": None,
+                },
+            ),
+            (
+                {"item_type": "task", "item_id": "123"},
+                {"status_code": 404, "item_type": "task", "item_id": "123"},
+            ),
+            (
+                {},
+                {"status_code": 404, "item_type": None, "item_id": None},
+            ),
+            (
+                {"message": "Not found", "detail": "This specific item was archived"},
+                {"detail": "This specific item was archived"},
+            ),
+            (
+                {"item_type": "project"},
+                {"item_type": "project", "item_id": None},
+            ),
+            (
+                {"item_id": "999"},
+                {"item_type": None, "item_id": "999"},
+            ),
+            (
+                {"message": "Explicit message", "item_type": "task", "item_id": "123"},
+                {"item_type": "task", "item_id": "123"},
+            ),
+            (
+                {
+                    "message": "Custom message",
+                    "detail": "Custom detail",
+                    "item_type": "document",
+                    "item_id": "doc-456",
+                },
+                {
+                    "message": "Custom message",
+                    "detail": "Custom detail",
+                    "status_code": 404,
+                    "item_type": "document",
+                    "item_id": "doc-456",
+                },
+            ),
+        ],
+        ids=[
+            "explicit_message",
+            "item_type_and_id",
+            "defaults",
+            "custom_detail",
+            "item_type_only",
+            "item_id_only",
+            "explicit_message_keeps_item_info",
+            "all_parameters",
+        ],
+    )
+    def test_constructor(self, kwargs, expected):
+        """Test constructor arguments map to the expected attributes."""
+        assert_attrs(ItemNotFoundError(**kwargs), **expected)
+
+    @pytest.mark.parametrize("kwargs,message", _NOT_FOUND_MESSAGE_CASES)
+    def test_message(self, kwargs, message):
+        """Test the message generated from constructor arguments."""
+        assert ItemNotFoundError(**kwargs).message == message
 
 
 class TestItemValidationError:
     """Test ItemValidationError class."""
 
-    def test_inherits_from_base_item_exception(self):
-        """Test that ItemValidationError inherits from BaseItemException."""
-        assert issubclass(ItemValidationError, BaseItemException)
-
-    def test_constructor_with_message_only(self):
-        """Test creating exception with only message."""
-        exception = ItemValidationError("Validation failed")
-
-        assert exception.message == "Validation failed"
-        assert exception.status_code == 400
-        assert exception.detail == "Check item for missing fields"
-        assert exception.field is None
-        assert exception.value is None
-        assert exception.errors == []
-
-    def test_constructor_with_field_generates_detail(self):
-        """Test that providing field generates appropriate detail."""
-        exception = ItemValidationError("Invalid field", field="email")
-
-        assert exception.message == "Invalid field"
-        assert exception.detail == "Validation failed for field: email"
-        assert exception.field == "email"
-
-    def test_constructor_with_errors_list_generates_detail(self):
-        """Test that providing errors list generates appropriate detail."""
-        errors = ["error1", "error2", "error3"]
-        exception = ItemValidationError("Multiple errors", errors=errors)
-
-        assert exception.message == "Multiple errors"
-        assert exception.detail == "Multiple validation errors: 3 fields"
-        assert exception.errors == errors
-
-    def test_constructor_with_field_and_value(self):
-        """Test creating exception with field and value."""
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"message": "Validation failed"},
+                {
+                    "message": "Validation failed",
+                    "status_code": 400,
+                    "detail": _VALIDATION_DETAIL,
+                    "field": None,
+                    "value": None,
+                    "errors": [],
+                },
+            ),
+            (
+                {
+                    "message": "Invalid email format",
+                    "field": "email",
+                    "value": "not-an-email",
+                },
+                {
+                    "field": "email",
+                    "value": "not-an-email",
+                    "detail": _EMAIL_FIELD_DETAIL,
+                },
+            ),
+            (
+                {
+                    "message": "Comprehensive validation error",
+                    "detail": "Custom detail",
+                    "field": "password",
+                    "value": "weak",
+                    "errors": ["Missing required field", "Invalid format"],
+                },
+                {
+                    "message": "Comprehensive validation error",
+                    "detail": "Validation failed for field: password",
+                    "field": "password",
+                    "value": "weak",
+                    "errors": ["Missing required field", "Invalid format"],
+                },
+            ),
+            (
+                {"message": "Test", "errors": None},
+                {"errors": []},
+            ),
+        ],
+        ids=[
+            "message_only",
+            "field_and_value",
+            "all_parameters",
+            "errors_none_defaults_to_empty_list",
+        ],
+    )
+    def test_constructor(self, kwargs, expected):
+        """Test constructor arguments map to the expected attributes."""
+        assert_attrs(ItemValidationError(**kwargs), **expected)
+
+    @pytest.mark.parametrize("detail,field,errors,expected", _DETAIL_RULES)
+    def test_detail_precedence(self, detail, field, errors, expected):
+        """Test field beats errors, which beat the given detail, then the default."""
         exception = ItemValidationError(
-            "Invalid email format", field="email", value="not-an-email"
+            "Validation failed", detail=detail, field=field, errors=errors
         )
 
-        assert exception.field == "email"
-        assert exception.value == "not-an-email"
-        assert exception.detail == "Validation failed for field: email"
-
-    def test_constructor_with_custom_detail_gets_overridden_by_field(self):
-        """Test that field generation overrides custom detail."""
-        exception = ItemValidationError(
-            "Custom validation error", detail="Custom detail message", field="username"
-        )
-
-        # Field takes priority and overrides custom detail
-        assert exception.detail == "Validation failed for field: username"
-        assert exception.field == "username"
-
-    def test_constructor_with_custom_detail_only(self):
-        """Test that custom detail is preserved when no field/errors provided."""
-        exception = ItemValidationError(
-            "Custom validation error", detail="Custom detail message"
-        )
-
-        # No field or errors, so custom detail should be preserved
-        assert exception.detail == "Custom detail message"
-        assert exception.field is None
-        assert exception.errors == []
-
-    def test_constructor_with_all_parameters(self):
-        """Test creating exception with all parameters."""
-        errors = ["Missing required field", "Invalid format"]
-        exception = ItemValidationError(
-            message="Comprehensive validation error",
-            detail="Custom detail",
-            field="password",
-            value="weak",
-            errors=errors,
-        )
-
-        assert exception.message == "Comprehensive validation error"
-        # Field takes priority over custom detail
-        assert exception.detail == "Validation failed for field: password"
-        assert exception.field == "password"
-        assert exception.value == "weak"
-        assert exception.errors == errors
-
-    def test_errors_defaults_to_empty_list(self):
-        """Test that errors defaults to empty list when None."""
-        exception = ItemValidationError("Test", errors=None)
-
-        assert exception.errors == []
-
-    def test_field_priority_over_errors_for_detail(self):
-        """Test that field takes priority over errors for detail generation."""
-        errors = ["error1", "error2"]
-        exception = ItemValidationError(
-            "Test message", field="priority_field", errors=errors
-        )
-
-        assert exception.detail == "Validation failed for field: priority_field"
-        assert exception.field == "priority_field"
-        assert exception.errors == errors
+        assert exception.detail == expected
 
 
 class TestItemDateParsingError:
     """Test ItemDateParsingError class."""
 
-    def test_inherits_from_item_validation_error(self):
-        """Test that ItemDateParsingError inherits from ItemValidationError."""
-        assert issubclass(ItemDateParsingError, ItemValidationError)
-        assert issubclass(ItemDateParsingError, BaseItemException)
-
-    def test_constructor_with_explicit_message(self):
-        """Test creating exception with explicit message."""
-        exception = ItemDateParsingError("Custom date error")
-
-        assert exception.message == "Custom date error"
-        assert exception.status_code == 400
-        assert exception.date_string is None
-
-    def test_constructor_with_date_string_generates_message(self):
-        """Test that providing date_string generates appropriate message."""
-        exception = ItemDateParsingError(date_string="invalid-date")
-
-        assert exception.message == "Invalid date format: 'invalid-date'"
-        assert exception.date_string == "invalid-date"
-
-    def test_constructor_without_message_or_date_string(self):
-        """Test creating exception without message or date_string uses default."""
-        exception = ItemDateParsingError()
-
-        assert exception.message == "Date format is invalid"
-        assert exception.date_string is None
-
-    def test_constructor_with_field_parameter(self):
-        """Test creating exception with field parameter."""
-        exception = ItemDateParsingError(date_string="2023-13-45", field="due_date")
-
-        assert exception.message == "Invalid date format: '2023-13-45'"
-        assert exception.field == "due_date"
-        assert exception.value == "2023-13-45"
-        assert exception.date_string == "2023-13-45"
-
-    def test_constructor_explicit_message_overrides_generation(self):
-        """Test that explicit message overrides generation."""
-        exception = ItemDateParsingError(
-            message="Explicit date error", date_string="bad-date"
-        )
-
-        assert exception.message == "Explicit date error"
-        assert exception.date_string == "bad-date"
-
-    def test_all_parameters_together(self):
-        """Test creating exception with all parameters."""
-        exception = ItemDateParsingError(
-            message="Custom date parsing error",
-            date_string="2023-99-99",
-            field="created_at",
-        )
-
-        assert exception.message == "Custom date parsing error"
-        assert exception.date_string == "2023-99-99"
-        assert exception.field == "created_at"
-        assert exception.value == "2023-99-99"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"message": "Custom date error"},
+                {
+                    "message": "Custom date error",
+                    "status_code": 400,
+                    "date_string": None,
+                },
+            ),
+            (
+                {"date_string": "invalid-date"},
+                {"date_string": "invalid-date"},
+            ),
+            (
+                {},
+                {"date_string": None},
+            ),
+            (
+                {"date_string": "2023-13-45", "field": "due_date"},
+                {
+                    "message": "Invalid date format: '2023-13-45'",
+                    "field": "due_date",
+                    "value": "2023-13-45",
+                    "date_string": "2023-13-45",
+                },
+            ),
+            (
+                {"message": "Explicit date error", "date_string": "bad-date"},
+                {"date_string": "bad-date"},
+            ),
+            (
+                {
+                    "message": "Custom date parsing error",
+                    "date_string": "2023-99-99",
+                    "field": "created_at",
+                },
+                {
+                    "message": "Custom date parsing error",
+                    "date_string": "2023-99-99",
+                    "field": "created_at",
+                    "value": "2023-99-99",
+                },
+            ),
+        ],
+        ids=[
+            "explicit_message",
+            "date_string",
+            "defaults",
+            "field_and_date_string",
+            "explicit_message_keeps_attributes",
+            "all_parameters",
+        ],
+    )
+    def test_constructor(self, kwargs, expected):
+        """Test constructor arguments map to the expected attributes."""
+        assert_attrs(ItemDateParsingError(**kwargs), **expected)
+
+    @pytest.mark.parametrize("kwargs,message", _DATE_MESSAGE_CASES)
+    def test_message(self, kwargs, message):
+        """Test the message generated from constructor arguments."""
+        assert ItemDateParsingError(**kwargs).message == message
 
     def test_inherits_validation_error_behavior(self):
         """Test that it inherits ItemValidationError behavior."""
         exception = ItemDateParsingError("Date error", field="timestamp")
 
         # Should have validation error detail generation
-        assert exception.detail == "Validation failed for field: timestamp"
-        assert exception.status_code == 400
+        assert_attrs(
+            exception,
+            detail="Validation failed for field: timestamp",
+            status_code=400,
+        )
 
 
 class TestItemStateTransitionError:
     """Test ItemStateTransitionError class."""
 
-    def test_inherits_from_item_validation_error(self):
-        """Test that ItemStateTransitionError inherits from ItemValidationError."""
-        assert issubclass(ItemStateTransitionError, ItemValidationError)
-
-    def test_constructor_with_explicit_message(self):
-        """Test creating exception with explicit message."""
-        exception = ItemStateTransitionError("Custom state error")
-
-        assert exception.message == "Custom state error"
-        assert exception.status_code == 400
-
-    def test_constructor_with_state_info_generates_message(self):
-        """Test that providing state info generates appropriate message."""
-        exception = ItemStateTransitionError(
-            item_type="task", current_state="completed", attempted_action="delete"
-        )
-
-        assert exception.message == "Cannot delete task in completed state"
-        assert exception.item_type == "task"
-        assert exception.current_state == "completed"
-        assert exception.attempted_action == "delete"
-
-    def test_constructor_without_message_or_state_info(self):
-        """Test creating exception without message or state info uses default."""
-        exception = ItemStateTransitionError()
-
-        assert exception.message == "Invalid state transition attempted"
-        assert exception.item_type is None
-        assert exception.current_state is None
-        assert exception.attempted_action is None
-
-    def test_constructor_with_partial_state_info(self):
-        """Test creating exception with partial state info uses default message."""
-        # Missing attempted_action
-        exception1 = ItemStateTransitionError(
-            item_type="document", current_state="draft"
-        )
-        assert exception1.message == "Invalid state transition attempted"
-
-        # Missing current_state
-        exception2 = ItemStateTransitionError(
-            item_type="task", attempted_action="archive"
-        )
-        assert exception2.message == "Invalid state transition attempted"
-
-    def test_constructor_with_custom_detail(self):
-        """Test creating exception with custom detail."""
-        exception = ItemStateTransitionError(
-            "State error", detail="Custom transition detail"
-        )
-
-        assert exception.detail == "Custom transition detail"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"message": "Custom state error"},
+                {"message": "Custom state error", "status_code": 400},
+            ),
+            (
+                {
+                    "item_type": "task",
+                    "current_state": "completed",
+                    "attempted_action": "delete",
+                },
+                {
+                    "item_type": "task",
+                    "current_state": "completed",
+                    "attempted_action": "delete",
+                },
+            ),
+            (
+                {},
+                {
+                    "item_type": None,
+                    "current_state": None,
+                    "attempted_action": None,
+                },
+            ),
+            (
+                {"message": "State error", "detail": "Custom transition detail"},
+                {"detail": "Custom transition detail"},
+            ),
+            (
+                {
+                    "message": "Explicit state error",
+                    "item_type": "project",
+                    "current_state": "active",
+                    "attempted_action": "start",
+                },
+                {"item_type": "project"},
+            ),
+            (
+                {
+                    "message": "Custom state transition error",
+                    "detail": "Custom detail",
+                    "item_type": "workflow",
+                    "current_state": "pending",
+                    "attempted_action": "cancel",
+                },
+                {
+                    "message": "Custom state transition error",
+                    "detail": "Custom detail",
+                    "item_type": "workflow",
+                    "current_state": "pending",
+                    "attempted_action": "cancel",
+                },
+            ),
+        ],
+        ids=[
+            "explicit_message",
+            "state_info",
+            "defaults",
+            "custom_detail",
+            "explicit_message_keeps_attributes",
+            "all_parameters",
+        ],
+    )
+    def test_constructor(self, kwargs, expected):
+        """Test constructor arguments map to the expected attributes."""
+        assert_attrs(ItemStateTransitionError(**kwargs), **expected)
+
+    @pytest.mark.parametrize("kwargs,message", _STATE_MESSAGE_CASES)
+    def test_message(self, kwargs, message):
+        """Test the message generated from constructor arguments."""
+        assert ItemStateTransitionError(**kwargs).message == message
 
     def test_constructor_default_detail(self):
         """Test that default detail is set when none provided."""
         exception = ItemStateTransitionError("State error")
 
-        assert "Check the current state and allowed transitions" in exception.detail
-
-    def test_explicit_message_overrides_generation(self):
-        """Test that explicit message overrides smart generation."""
-        exception = ItemStateTransitionError(
-            message="Explicit state error",
-            item_type="project",
-            current_state="active",
-            attempted_action="start",
-        )
-
-        assert exception.message == "Explicit state error"
-        assert exception.item_type == "project"
-
-    def test_all_parameters_together(self):
-        """Test creating exception with all parameters."""
-        exception = ItemStateTransitionError(
-            message="Custom state transition error",
-            detail="Custom detail",
-            item_type="workflow",
-            current_state="pending",
-            attempted_action="cancel",
-        )
-
-        assert exception.message == "Custom state transition error"
-        assert exception.detail == "Custom detail"
-        assert exception.item_type == "workflow"
-        assert exception.current_state == "pending"
-        assert exception.attempted_action == "cancel"
+        assert exception.detail == _STATE_DETAIL
 
 
 class TestItemConflictError:
     """Test ItemConflictError class."""
 
-    def test_inherits_from_base_item_exception(self):
-        """Test that ItemConflictError inherits from BaseItemException."""
-        assert issubclass(ItemConflictError, BaseItemException)
-
-    def test_constructor_with_message_only(self):
-        """Test creating exception with only message."""
-        exception = ItemConflictError("Conflict detected")
-
-        assert exception.message == "Conflict detected"
-        assert exception.status_code == 409
-        assert exception.detail == "Resolve the conflict and try again"
-        assert exception.conflicting_field is None
-        assert exception.conflicting_value is None
-
-    def test_constructor_with_conflicting_field(self):
-        """Test creating exception with conflicting field."""
-        exception = ItemConflictError(
-            "Username already exists", conflicting_field="username"
-        )
-
-        assert exception.message == "Username already exists"
-        assert exception.conflicting_field == "username"
-
-    def test_constructor_with_conflicting_value(self):
-        """Test creating exception with conflicting value."""
-        exception = ItemConflictError(
-            "Email conflict", conflicting_value="user@example.com"
-        )
-
-        assert exception.conflicting_value == "user@example.com"
-
-    def test_constructor_with_field_and_value(self):
-        """Test creating exception with both field and value."""
-        exception = ItemConflictError(
-            "Duplicate entry detected",
-            conflicting_field="email",
-            conflicting_value="test@example.com",
-        )
-
-        assert exception.conflicting_field == "email"
-        assert exception.conflicting_value == "test@example.com"
-
-    def test_conflicting_value_can_be_any_type(self):
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"message": "Conflict detected"},
+                {
+                    "message": "Conflict detected",
+                    "status_code": 409,
+                    "detail": _CONFLICT_DETAIL,
+                    "conflicting_field": None,
+                    "conflicting_value": None,
+                },
+            ),
+            (
+                {
+                    "message": "Username already exists",
+                    "conflicting_field": "username",
+                },
+                {
+                    "message": "Username already exists",
+                    "conflicting_field": "username",
+                },
+            ),
+            (
+                {
+                    "message": "Email conflict",
+                    "conflicting_value": "user@example.com",
+                },
+                {"conflicting_value": "user@example.com"},
+            ),
+            (
+                {
+                    "message": "Duplicate entry detected",
+                    "conflicting_field": "email",
+                    "conflicting_value": "test@example.com",
+                },
+                {
+                    "conflicting_field": "email",
+                    "conflicting_value": "test@example.com",
+                },
+            ),
+        ],
+        ids=[
+            "message_only",
+            "conflicting_field",
+            "conflicting_value",
+            "field_and_value",
+        ],
+    )
+    def test_constructor(self, kwargs, expected):
+        """Test constructor arguments map to the expected attributes."""
+        assert_attrs(ItemConflictError(**kwargs), **expected)
+
+    @pytest.mark.parametrize(
+        "value",
+        [123, ["list", "value"], {"dict": "value"}, None, True],
+        ids=["int", "list", "dict", "none", "bool"],
+    )
+    def test_conflicting_value_can_be_any_type(self, value):
         """Test that conflicting_value can be any type."""
-        # Test with different types
-        test_values = [123, ["list", "value"], {"dict": "value"}, None, True]
-
-        for value in test_values:
-            exception = ItemConflictError("Type test", conflicting_value=value)
-            assert exception.conflicting_value == value
-
-    def test_status_code_is_409(self):
-        """Test that status code is always 409 for conflicts."""
-        exception = ItemConflictError("Any conflict message")
+        exception = ItemConflictError("Type test", conflicting_value=value)
 
-        assert exception.status_code == 409
-
-    def test_default_detail_message(self):
-        """Test that default detail message is consistent."""
-        exception = ItemConflictError("Conflict")
-
-        assert exception.detail == "Resolve the conflict and try again"
+        assert exception.conflicting_value == value
 
 
 class TestExceptionHierarchy:
     """Test the exception hierarchy and inheritance relationships."""
 
-    def test_inheritance_chain(self):
-        """Test the complete inheritance chain."""
-        # BaseItemException -> BaseAPIException -> Exception
-        assert issubclass(BaseItemException, BaseAPIException)
-        assert issubclass(BaseAPIException, Exception)
-
-        # ItemNotFoundError -> BaseItemException
-        assert issubclass(ItemNotFoundError, BaseItemException)
-
-        # ItemValidationError -> BaseItemException
-        assert issubclass(ItemValidationError, BaseItemException)
-
-        # ItemDateParsingError -> ItemValidationError
-        assert issubclass(ItemDateParsingError, ItemValidationError)
-
-        # ItemStateTransitionError -> ItemValidationError
-        assert issubclass(ItemStateTransitionError, ItemValidationError)
-
-        # ItemConflictError -> BaseItemException
-        assert issubclass(ItemConflictError, BaseItemException)
-
-    def test_all_item_exceptions_can_be_caught_as_base_item_exception(self):
-        """Test that all item exceptions can be caught as BaseItemException."""
-        exceptions = [
-            ItemNotFoundError("Not found"),
-            ItemValidationError("Validation error"),
-            ItemDateParsingError("Date error"),
-            ItemStateTransitionError("State error"),
-            ItemConflictError("Conflict error"),
-        ]
-
-        for exc in exceptions:
-            with pytest.raises(BaseItemException):
-                raise exc
-
-    def test_validation_errors_can_be_caught_as_item_validation_error(self):
-        """Test that validation-related errors can be caught as ItemValidationError."""
-        validation_exceptions = [
-            ItemValidationError("Basic validation"),
-            ItemDateParsingError("Date validation"),
-            ItemStateTransitionError("State validation"),
-        ]
-
-        for exc in validation_exceptions:
-            with pytest.raises(ItemValidationError):
-                raise exc
-
-    def test_status_codes_are_inherited_correctly(self):
+    @pytest.mark.parametrize("child,parent", _HIERARCHY, ids=lambda cls: cls.__name__)
+    def test_inheritance(self, child, parent):
+        """Test each direct parent/child link in the hierarchy."""
+        assert issubclass(child, parent)
+
+    @pytest.mark.parametrize(
+        "exception_class,status_code",
+        _STATUS_CODES,
+        ids=[cls.__name__ for cls, _ in _STATUS_CODES],
+    )
+    def test_status_codes_are_inherited_correctly(self, exception_class, status_code):
         """Test that status codes are set correctly in the hierarchy."""
-        # 404 for not found
-        not_found = ItemNotFoundError("Not found")
-        assert not_found.status_code == 404
-
-        # 400 for validation errors
-        validation = ItemValidationError("Validation")
-        assert validation.status_code == 400
+        assert exception_class("Status test").status_code == status_code
 
-        date_parsing = ItemDateParsingError("Date error")
-        assert date_parsing.status_code == 400
-
-        state_transition = ItemStateTransitionError("State error")
-        assert state_transition.status_code == 400
-
-        # 409 for conflicts
-        conflict = ItemConflictError("Conflict")
-        assert conflict.status_code == 409
-
-    def test_base_api_exception_attributes_preserved(self):
+    def test_base_api_exception_attributes_preserved(self, not_found_task):
         """Test that BaseAPIException attributes are preserved."""
-        exception = ItemNotFoundError("Test", item_type="task", item_id="123")
-
-        # Should have BaseAPIException attributes
-        assert hasattr(exception, "message")
-        assert hasattr(exception, "status_code")
-        assert hasattr(exception, "detail")
-        assert hasattr(exception, "should_alert")
-
-        # Should also have item-specific attributes
-        assert hasattr(exception, "item_type")
-        assert hasattr(exception, "item_id")
+        # A missing attribute fails with AttributeError from the direct read
+        assert_attrs(
+            not_found_task,
+            message="Task '123' not found",
+            status_code=404,
+            detail=_NOT_FOUND_DETAIL,
+            should_alert=False,
+            item_type="task",
+            item_id="123",
+        )
 
 
 class TestExceptionIntegration:
     """Test integration scenarios and real-world usage patterns."""
 
-    def test_exception_serialization_compatibility(self):
+    def test_exception_serialization_compatibility(self, any_item_exception):
         """Test that exceptions work with string representation."""
-        exceptions = [
-            ItemNotFoundError("Task not found"),
-            ItemValidationError("Invalid email"),
-            ItemDateParsingError("Bad date format"),
-            ItemStateTransitionError("Cannot transition"),
-            ItemConflictError("Username exists"),
-        ]
-
-        for exc in exceptions:
-            assert str(exc) == exc.message
-            assert repr(exc)  # Should not raise
+        assert str(any_item_exception) == any_item_exception.message
+        assert repr(any_item_exception)  # Should not raise
 
     def test_exception_with_original_error_chaining(self):
         """Test exception chaining works with item exceptions using BaseAPIException."""
-        try:
-            raise ValueError("Database connection failed")
-        except ValueError as original:
-            # Item exceptions don't expose original_error in constructor
-            # but we can test that they inherit from BaseAPIException
-            # which supports original error chaining
-            from app.src.core.exceptions.base_exceptions import BaseAPIException
-
-            base_exception = BaseAPIException(
-                "Item not found due to database error", original_error=original
-            )
-
-            assert base_exception.__cause__ is original
-
-            # And test that item exceptions are indeed BaseAPIExceptions
-            item_exception = ItemNotFoundError("Test")
-            assert isinstance(item_exception, BaseAPIException)
-
-    def test_realistic_usage_scenarios(self):
-        """Test realistic usage scenarios for each exception type."""
-        # Not found scenario
-        task_not_found = ItemNotFoundError(item_type="task", item_id="task-123")
-        assert task_not_found.message == "Task 'task-123' not found"
-        assert task_not_found.status_code == 404
-
-        # Validation scenario
-        email_validation = ItemValidationError(
-            "Invalid email format", field="email", value="not-an-email"
-        )
-        assert email_validation.status_code == 400
-        assert "email" in email_validation.detail
-
-        # Date parsing scenario
-        date_error = ItemDateParsingError(date_string="2023-13-45", field="due_date")
-        assert "Invalid date format" in date_error.message
-        assert date_error.field == "due_date"
-
-        # State transition scenario
-        state_error = ItemStateTransitionError(
-            item_type="task", current_state="completed", attempted_action="edit"
-        )
-        assert state_error.message == "Cannot edit task in completed state"
-
-        # Conflict scenario
-        conflict_error = ItemConflictError(
-            "Email already registered",
-            conflicting_field="email",
-            conflicting_value="user@example.com",
+        # Item exceptions don't expose original_error in constructor
+        # but we can test that they inherit from BaseAPIException
+        # which supports original error chaining
+        base_exception = BaseAPIException(
+            "Item not found due to database error", original_error=_ORIGINAL_ERR
         )
-        assert conflict_error.status_code == 409
-
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+        assert base_exception.__cause__ is _ORIGINAL_ERR
+
+    @pytest.mark.parametrize(
+        "scenario,expected",
+        [
+            pytest.param(
+                "not_found_task",
+                {"message": "Task '123' not found", "status_code": 404},
+                id="not_found",
+            ),
+            pytest.param(
+                "validation_email",
+                {"status_code": 400, "detail": _EMAIL_FIELD_DETAIL},
+                id="email_validation",
+            ),
+            pytest.param(
+                "date_error",
+                {"message": "Invalid date format: '2023-13-45'", "field": "due_date"},
+                id="date_parsing",
+            ),
+            pytest.param(
+                "state_error",
+                {"message": "Cannot edit task in completed state"},
+                id="state_transition",
+            ),
+            pytest.param(
+                "conflict_error",
+                {"status_code": 409, "conflicting_field": "email"},
+                id="conflict",
+            ),
+        ],
+    )
+    def test_realistic_usage_scenarios(self, request, scenario, expected):
+        """Test realistic usage scenarios for each exception type."""
+        assert_attrs(request.getfixturevalue(scenario), **expected)
@@ -2,13 +2,11 @@ import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 from fastapi.responses import JSONResponse
 
 from app.src.core.middleware.rate_limiting import PerKeyRateLimitMiddleware
 
 
-@pytest.mark.asyncio
 async def test_rate_limiting_comprehensive():
     """Comprehensive test for rate limiting middleware with detailed verification"""
 
@@ -137,7 +135,6 @@ async def test_rate_limiting_comprehensive():
     print("\n=== All rate limiting tests passed! ===")
 
 
-@pytest.mark.asyncio
 async def test_concurrent_requests():
     """Test rate limiting under concurrent load"""
 